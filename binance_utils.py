@@ -1,18 +1,76 @@
 import os
 import sys
+import math
+import asyncio
 import time
+import threading
 import hmac
-import hashlib
+import itertools
+import json
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from binance.client import Client
 from binance.enums import KLINE_INTERVAL_5MINUTE
 from core.logger import global_logger as logger
 from core.config import CONFIG
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # stdlib fallback
+    _loads = json.loads
+
+try:
+    import aiodns  # noqa: F401  (enables aiohttp.AsyncResolver)
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+
+def _keyed_hmac() -> "hmac.HMAC":
+    """HMAC-SHA256 keyed with the API secret once; callers sign with a .copy()."""
+    return hmac.new((os.getenv("BINANCE_API_SECRET") or "").encode("utf-8"), digestmod="sha256")
+
+
+# Client order ids: per-process ms epoch + counter, unique across restarts, no uuid
+_COID_EPOCH = f"{time.time_ns() // 1_000_000:x}"
+_COID_SEQ = itertools.count()
+
+
+ORDER_UNKNOWN = "UNKNOWN"  # placement outcome not confirmed either way
+
+
+def next_coid() -> str:
+    """Next newClientOrderId (well under Binance's 36-char limit)."""
+    return f"bot{_COID_EPOCH}-{next(_COID_SEQ):x}"
+
+
+def unknown_order(client_order_id: str) -> dict:
+    """Result for an order that may have reached Binance but was never confirmed."""
+    return {"status": ORDER_UNKNOWN, "clientOrderId": client_order_id}
+
+
+def _fmt_decimal(x: float) -> str:
+    """Plain decimal string for a REST parameter (never scientific notation)."""
+    return f"{x:.8f}".rstrip("0").rstrip(".")
+
+
+def _merge_klines(cached: List, new: List, limit: int) -> List:
+    """Replace cached candles from the first new open time onward, keep the last `limit`."""
+    if not new:
+        return cached
+    first_open = new[0][0]
+    keep = len(cached)
+    while keep and cached[keep - 1][0] >= first_open:
+        keep -= 1
+    return (cached[:keep] + new)[-limit:]
+
 
 class BinanceClient:
+    PING_TTL = 30.0  # seconds a successful ping is trusted
+
     def __init__(self):
         self.client = Client(
             api_key=os.getenv("BINANCE_API_KEY"),
@@ -20,34 +78,96 @@ class BinanceClient:
         )
         self.config = CONFIG
         self._time_offset_ms = 0  # local offset vs Binance
+        self._last_ok = 0.0  # last successful ping (time.time())
+        self._hmac = _keyed_hmac()
+
+        # Shared keep-alive session for signed REST calls (reuses TCP+TLS)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("https://", adapter)
+        api_key = os.getenv("BINANCE_API_KEY")
+        if api_key:
+            self.session.headers.update({"X-MBX-APIKEY": api_key})
+
+        # Resolve underlying client endpoints once (dispatch table)
+        self._m: Dict[str, Optional[Callable]] = {}
+        self._price_kind: Optional[str] = None
+        self._resolve_methods()
+
+        # Exchange-info indexed by symbol; filled by load_symbol_info()
+        self._symbol_info_cache: Dict[str, dict] = {}
+        self._filters_cache: Dict[str, Dict[str, dict]] = {}
+        self._precision_cache: Dict[str, Tuple[float, float, float]] = {}
+
+    def _first_callable(self, *names: str) -> Tuple[Optional[Callable], Optional[str]]:
+        for name in names:
+            fn = getattr(self.client, name, None)
+            if callable(fn):
+                return fn, name
+        return None, None
+
+    def _resolve_methods(self) -> None:
+        """Bind the client's endpoint for each operation; public methods only index self._m."""
+        self._m["price"], self._price_kind = self._first_callable(
+            "get_symbol_ticker", "ticker_price", "get_avg_price", "get_price"
+        )
+        self._m["symbol_info"], _ = self._first_callable("get_symbol_info")
+        self._m["exchange_info"], _ = self._first_callable("get_exchange_info")
+        self._m["klines"], _ = self._first_callable("get_klines", "klines")
+        self._m["positions"], _ = self._first_callable(
+            "futures_position_information", "get_positions"
+        )
+        self._m["ping"], _ = self._first_callable("futures_ping", "ping")
 
     def _now_ms(self) -> int:
         return int(time.time() * 1000)
 
     def sync_time_with_binance(self) -> int:
         """Sync local offset with Binance server time (no system clock change)."""
-        try:
-            srv = self.client.futures_time()
-            server_time = int(srv.get("serverTime", 0))
-            local_ms = self._now_ms()
-            self._time_offset_ms = local_ms - server_time
-            if hasattr(self.client, "TIME_OFFSET"):
-                self.client.TIME_OFFSET = int(self._time_offset_ms)
-            logger.log_info(
-                f"Binance offset sync: server={server_time}, local={local_ms}, offset={self._time_offset_ms}ms"
-            )
+        fn = getattr(self.client, "futures_time", None)
+        if fn is None:
             return int(self._time_offset_ms)
+        try:
+            srv = fn()
         except Exception as e:
             logger.log_warning(f"Failed to sync offset with Binance: {e}")
             return int(self._time_offset_ms)
+        server_time = int(srv.get("serverTime", 0))
+        local_ms = self._now_ms()
+        self._time_offset_ms = local_ms - server_time
+        if getattr(self.client, "TIME_OFFSET", None) is not None:
+            self.client.TIME_OFFSET = int(self._time_offset_ms)
+        logger.log_info(
+            f"Binance offset sync: server={server_time}, local={local_ms}, offset={self._time_offset_ms}ms"
+        )
+        return int(self._time_offset_ms)
+
+    def time_offset_ms(self) -> int:
+        """Local clock minus Binance server time, as of the last sync_time_with_binance()."""
+        return int(self._time_offset_ms)
+
+    def ping(self) -> bool:
+        """Cheap health probe; a success within PING_TTL is reused without a request."""
+        now = time.time()
+        if now - self._last_ok < self.PING_TTL:
+            return True
+        fn = self._m["ping"]
+        if fn is None:
+            return False
+        try:
+            fn()
+            self._last_ok = now
+            return True
+        except Exception as e:
+            logger.log_warning(f"Binance ping failed: {e}")
+            return False
 
     def _sign(self, params: dict) -> dict:
         """Sign params with API secret."""
-        query = urlencode(params)
-        secret = os.getenv("BINANCE_API_SECRET")
-        signature = hmac.new(
-            secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        query = urlencode(params).encode("utf-8")
+        h = self._hmac.copy()  # key pads already absorbed
+        h.update(query)
+        signature = h.hexdigest()
         params["signature"] = signature
         return params
 
@@ -56,14 +176,40 @@ class BinanceClient:
     ) -> List:
         if limit is None:
             limit = self.config["scalper_settings"].get("min_candles", 300)
+        fn = self._m["klines"]
+        if fn is None:
+            return []
         try:
-            klines = self.client.get_klines(symbol=symbol, interval=timeframe, limit=limit)
+            klines = fn(symbol=symbol, interval=timeframe, limit=limit)
             logger.log_debug(f"{symbol} fetched {len(klines)} klines")
             return klines
         except Exception as e:
             logger.log_error(f"{symbol} ❌ Failed to fetch klines: {e}")
             return []
 
+    def fetch_klines_incremental(
+        self, symbol: str, cached: Optional[List], timeframe: str = KLINE_INTERVAL_5MINUTE, limit: int = None
+    ) -> List:
+        """
+        Refresh a cached kline list by fetching only candles from the last cached
+        open time onward (the last one may still have been forming).
+        Falls back to a full fetch when the cache is empty or short.
+        """
+        if limit is None:
+            limit = self.config["scalper_settings"].get("min_candles", 300)
+        if not cached or len(cached) < limit:
+            return self.fetch_klines(symbol, timeframe, limit)
+        fn = self._m["klines"]
+        if fn is None:
+            return cached
+        try:
+            new = fn(symbol=symbol, interval=timeframe, startTime=int(cached[-1][0]), limit=limit)
+            logger.log_debug(f"{symbol} fetched {len(new)} incremental klines")
+            return _merge_klines(cached, new, limit)
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Failed to fetch incremental klines: {e}")
+            return cached
+
     def get_futures_balance(self) -> Optional[float]:
         """
         Fetch USDT futures wallet balance using manual signing.
@@ -72,14 +218,13 @@ class BinanceClient:
         - Retries once on -1021
         """
         url = "https://fapi.binance.com/fapi/v2/balance"
-        headers = {"X-MBX-APIKEY": os.getenv("BINANCE_API_KEY")}
 
         for attempt in range(2):
             try:
                 ts = int(time.time() * 1000) - int(self._time_offset_ms)
                 params = {"timestamp": ts, "recvWindow": 5000}
                 signed = self._sign(params)
-                r = requests.get(url, headers=headers, params=signed, timeout=5)
+                r = self.session.get(url, params=signed, timeout=5)
                 r.raise_for_status()
                 data = r.json()
                 for asset in data:
@@ -113,25 +258,322 @@ class BinanceClient:
         logger.log_error("Exhausted retries fetching futures balance.")
         return None
 
-    def get_symbol_info(self, symbol: str) -> Optional[dict]:
+    def load_symbol_info(self) -> int:
+        """Load exchange info once and index symbols/filters for O(1) lookups."""
+        fn = self._m["exchange_info"]
+        if fn is None:
+            return 0
         try:
-            info = self.client.get_symbol_info(symbol)
-            if not info:
+            info = fn()
+        except Exception as e:
+            logger.log_error(f"❌ Failed to load exchange info: {e}")
+            return len(self._symbol_info_cache)
+        self._precision_cache.clear()
+        for s in info.get("symbols", []):
+            self._cache_symbol(s)
+        logger.log_info(f"Loaded exchange info for {len(self._symbol_info_cache)} symbols")
+        return len(self._symbol_info_cache)
+
+    def _cache_symbol(self, info: dict) -> None:
+        symbol = info["symbol"]
+        self._symbol_info_cache[symbol] = info
+        self._filters_cache[symbol] = {f["filterType"]: f for f in info.get("filters", [])}
+
+    def _raw_symbol_info(self, symbol: str) -> Optional[dict]:
+        info = self._symbol_info_cache.get(symbol)
+        if info is None:
+            fn = self._m["symbol_info"]
+            if fn is None:
                 return None
-            filters = {f["filterType"]: f for f in info["filters"]}
-            return {
-                "quantityPrecision": info["quantityPrecision"],
-                "pricePrecision": info["pricePrecision"],
-                "minQuantity": float(filters["LOT_SIZE"]["minQty"]),
-            }
+            info = fn(symbol)
+            if info:
+                self._cache_symbol(info)
+        return info
+
+    def get_symbol_info(self, symbol: str) -> Optional[dict]:
+        try:
+            info = self._raw_symbol_info(symbol)
         except Exception as e:
             logger.log_error(f"{symbol} ❌ Failed to fetch symbol info: {e}")
             return None
+        if not info:
+            return None
+        lot = self._filters_cache[symbol].get("LOT_SIZE")
+        if lot is None or "quantityPrecision" not in info:
+            logger.log_error(f"{symbol} ❌ Symbol info missing LOT_SIZE/precision fields")
+            return None
+        return {
+            "quantityPrecision": info["quantityPrecision"],
+            "pricePrecision": info.get("pricePrecision"),
+            "minQuantity": float(lot["minQty"]),
+        }
+
+    def _get_filter(self, symbol: str, filter_type: str) -> dict:
+        filters = self._filters_cache.get(symbol)
+        if filters is None:
+            try:
+                self._raw_symbol_info(symbol)
+            except Exception as e:
+                logger.log_error(f"{symbol} ❌ Failed to fetch symbol info: {e}")
+            filters = self._filters_cache.get(symbol, {})
+        return filters.get(filter_type, {})
+
+    def _precision(self, symbol: str) -> Tuple[float, float, float]:
+        """(step_size, tick_size, min_notional) parsed once per symbol."""
+        p = self._precision_cache.get(symbol)
+        if p is not None:
+            return p
+        lot = self._get_filter(symbol, "LOT_SIZE")
+        if not lot:
+            return 0.0, 0.0, 0.0  # not cached: retry on next call
+        notional = self._get_filter(symbol, "MIN_NOTIONAL") or self._get_filter(symbol, "NOTIONAL")
+        p = (
+            float(lot.get("stepSize", 0.0)),
+            float(self._get_filter(symbol, "PRICE_FILTER").get("tickSize", 0.0)),
+            float(notional.get("minNotional", notional.get("notional", 0.0))),
+        )
+        self._precision_cache[symbol] = p
+        return p
+
+    def get_step_size(self, symbol: str) -> float:
+        return self._precision(symbol)[0]
+
+    def get_tick_size(self, symbol: str) -> float:
+        return self._precision(symbol)[1]
+
+    def get_min_notional(self, symbol: str) -> float:
+        return self._precision(symbol)[2]
+
+    def calculate_quantity(self, symbol: str, usd_amount: float, price: float) -> float:
+        """Quantity bought by usd_amount at price, floored to the symbol's step size."""
+        price = float(price)
+        if price <= 0:
+            return 0.0
+        qty = float(usd_amount) / price
+        step = self.get_step_size(symbol)
+        if step > 0:
+            qty = math.floor(qty / step) * step
+        return qty
+
+    def validate_order(self, symbol: str, price: float, qty: float) -> bool:
+        """Check qty/price against the cached exchange filters (no request once warm)."""
+        if qty <= 0 or price <= 0:
+            logger.log_error(f"{symbol} ❌ Invalid order: qty={qty}, price={price}")
+            return False
+        min_notional = self.get_min_notional(symbol)
+        if qty * price < min_notional:
+            logger.log_error(
+                f"{symbol} ❌ Notional {qty * price:.4f} below minimum {min_notional}"
+            )
+            return False
+        return True
 
     def get_price(self, symbol: str) -> Optional[float]:
+        fn = self._m["price"]
+        if fn is None:
+            logger.log_error(f"{symbol} ❌ No price endpoint available on client")
+            return None
         try:
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
+            ticker = fn(symbol) if self._price_kind == "get_price" else fn(symbol=symbol)
+            return float(ticker["price"]) if isinstance(ticker, dict) else float(ticker)
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Failed to fetch price: {e}")
+            return None
+
+
+    def get_futures_position(self, symbol: str) -> Optional[dict]:
+        """Return the first futures position entry reported for symbol."""
+        fn = self._m["positions"]
+        if fn is None:
+            return None
+        try:
+            positions = fn(symbol=symbol)
+            return positions[0] if positions else None
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Failed to fetch futures position: {e}")
+            return None
+
+    def get_all_prices(self) -> Dict[str, float]:
+        """Fetch every symbol price in one request: {symbol: price}."""
+        fn = getattr(self.client, "get_all_tickers", None)
+        if fn is None:
+            return {}
+        try:
+            tickers = fn()
+            return {t["symbol"]: float(t["price"]) for t in tickers}
+        except Exception as e:
+            logger.log_error(f"❌ Failed to fetch bulk prices: {e}")
+            return {}
+
+
+_default_client: Optional[BinanceClient] = None
+_default_lock = threading.Lock()
+
+
+def get_default_client() -> BinanceClient:
+    """Process-wide BinanceClient, constructed on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = BinanceClient()
+    return _default_client
+
+
+class AsyncBinanceClient:
+    """
+    Async client for concurrent per-symbol polling and futures order placement.
+    One aiohttp session (keep-alive connector) is reused for the life of the
+    event loop; call close() before the loop exits.
+    """
+
+    BASE_URL = "https://api.binance.com/api/v3"
+    FAPI_URL = "https://fapi.binance.com/fapi/v1"
+
+    def __init__(self):
+        self.config = CONFIG
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._api_key = os.getenv("BINANCE_API_KEY") or ""
+        self._hmac = _keyed_hmac()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                use_dns_cache=True,
+                ttl_dns_cache=3600,
+                keepalive_timeout=120,
+                resolver=aiohttp.AsyncResolver(nameservers=["1.1.1.1", "8.8.8.8"]) if _HAS_AIODNS else None,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    def session(self) -> aiohttp.ClientSession:
+        """The shared keep-alive session, for other clients on the same loop (e.g. the order socket)."""
+        return self._get_session()
+
+    async def fetch_klines(
+        self, symbol: str, timeframe: str = KLINE_INTERVAL_5MINUTE, limit: int = None
+    ) -> List:
+        if limit is None:
+            limit = self.config["scalper_settings"].get("min_candles", 300)
+        params = {"symbol": symbol, "interval": timeframe, "limit": limit}
+        try:
+            async with self._get_session().get(f"{self.BASE_URL}/klines", params=params) as r:
+                r.raise_for_status()
+                klines = await r.json()
+            logger.log_debug(f"{symbol} fetched {len(klines)} klines (async)")
+            return klines
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Failed to fetch klines: {e}")
+            return []
+
+    async def fetch_klines_incremental(
+        self, symbol: str, cached: Optional[List], timeframe: str = KLINE_INTERVAL_5MINUTE, limit: int = None
+    ) -> List:
+        """Async twin of BinanceClient.fetch_klines_incremental."""
+        if limit is None:
+            limit = self.config["scalper_settings"].get("min_candles", 300)
+        if not cached or len(cached) < limit:
+            return await self.fetch_klines(symbol, timeframe, limit)
+        params = {"symbol": symbol, "interval": timeframe, "startTime": int(cached[-1][0]), "limit": limit}
+        try:
+            async with self._get_session().get(f"{self.BASE_URL}/klines", params=params) as r:
+                r.raise_for_status()
+                new = await r.json()
+            logger.log_debug(f"{symbol} fetched {len(new)} incremental klines (async)")
+            return _merge_klines(cached, new, limit)
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Failed to fetch incremental klines: {e}")
+            return cached
+
+    async def get_price(self, symbol: str) -> Optional[float]:
+        try:
+            async with self._get_session().get(
+                f"{self.BASE_URL}/ticker/price", params={"symbol": symbol}
+            ) as r:
+                r.raise_for_status()
+                ticker = await r.json()
             return float(ticker["price"])
         except Exception as e:
             logger.log_error(f"{symbol} ❌ Failed to fetch price: {e}")
             return None
+
+    async def warm(self) -> None:
+        """Resolve DNS and open keep-alive connections to spot and futures before trading."""
+        async def _ping(url: str) -> None:
+            try:
+                async with self._get_session().get(url) as r:
+                    await r.read()
+            except Exception as e:
+                logger.log_warning(f"Connection warm-up to {url} failed: {e}")
+
+        await asyncio.gather(_ping(f"{self.BASE_URL}/ping"), _ping(f"{self.FAPI_URL}/ping"))
+
+    def _signed_body(self, query: str) -> str:
+        """Append timestamp, recvWindow and the HMAC signature to a prebuilt query."""
+        ts = int(time.time() * 1000) - get_default_client().time_offset_ms()
+        query = f"{query}&timestamp={ts}&recvWindow=5000"
+        h = self._hmac.copy()
+        h.update(query.encode("utf-8"))
+        signature = h.hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def place_market_async(
+        self, symbol: str, side: str, qty: float, client_order_id: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        POST a signed MARKET order to /fapi/v1/order. None when Binance rejected
+        it; unknown_order(coid) when the request failed in flight and the order
+        may or may not exist (reconcile with get_order_async).
+        """
+        coid = client_order_id or next_coid()
+        body = self._signed_body(
+            f"symbol={symbol}&side={side}&type=MARKET&quantity={_fmt_decimal(qty)}"
+            f"&newClientOrderId={coid}"
+        )
+        headers = {
+            "X-MBX-APIKEY": self._api_key,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        try:
+            async with self._get_session().post(
+                f"{self.FAPI_URL}/order", data=body, headers=headers
+            ) as r:
+                data = _loads(await r.read())
+                if r.status != 200:
+                    logger.log_error(
+                        f"{symbol} ❌ MARKET {side} rejected: {data.get('code')} {data.get('msg')}"
+                    )
+                    return None
+            return data
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ MARKET {side} outcome unknown ({coid}): {e}")
+            return unknown_order(coid)
+
+    async def get_order_async(self, symbol: str, client_order_id: str) -> Optional[dict]:
+        """
+        GET /fapi/v1/order by origClientOrderId: the order dict, {} when Binance
+        says it does not exist (-2013), None when the lookup itself failed.
+        """
+        query = self._signed_body(f"symbol={symbol}&origClientOrderId={client_order_id}")
+        try:
+            async with self._get_session().get(
+                f"{self.FAPI_URL}/order?{query}", headers={"X-MBX-APIKEY": self._api_key}
+            ) as r:
+                data = _loads(await r.read())
+                if r.status == 200:
+                    return data
+                if data.get("code") == -2013:
+                    return {}
+                logger.log_error(f"{symbol} ❌ Order lookup {client_order_id} failed: {data.get('code')} {data.get('msg')}")
+        except Exception as e:
+            logger.log_error(f"{symbol} ❌ Order lookup {client_order_id} failed: {e}")
+        return None
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,27 +1,46 @@
 # bot_main.py
+import asyncio
 import time
 import pandas as pd
 from typing import Dict, Optional
+from binance.client import Client
 from core.logger import global_logger as logger
 from core.config import get_scalper_config, get_scalper_usd_allocation
-from binance_utils import BinanceUtils
+from core import symbol_cache
+from core.signal_queue import SignalQueue
+from binance_utils import get_default_client
+from core.order_executor import async_client, ws_client, warmup as warmup_order_kernels
 from scalper_strategy import generate_binance_signal
+from core.analytics.cache_manager import rolling_cache
+from scalper.scalper_candle_listener import klines_to_arrays, arrays_to_dataframe
 from dotenv import load_dotenv
 import os
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows; stock asyncio loop is used
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
+POS_SYNC_INTERVAL = 60  # seconds between exchange position syncs
+_SIGNAL_SIDES = {"BUY": "LONG", "SELL": "SHORT"}  # order side -> Signal side
+
 class BinanceBot:
     def __init__(self):
         api_key = os.getenv("BINANCE_API_KEY")
         api_secret = os.getenv("BINANCE_API_SECRET")
         if not api_key or not api_secret:
             raise ValueError("API key or secret not found in .env")
-        self.utils = BinanceUtils(api_key, api_secret)
+        self.utils = get_default_client()
         self.utils.load_symbol_info()
         self.config = get_scalper_config()
         self.positions = {}  # Store open positions
+        self._last_sync = 0.0
+        self._next_wake = 0
+        # Prepared orders wait here, tightest stop first, and go out via execute_order
+        self.order_queue = SignalQueue(dispatch=self._execute_queued)
 
     def sync_positions(self):
         """Sync open positions with Binance for accurate state."""
@@ -45,23 +64,80 @@ class BinanceBot:
 
     def run(self):
         """Main bot loop, reading base_pairs from config.json."""
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(self._run_async())
+
+    async def _run_async(self):
         symbols = self.config['base_pairs']  # Read from config.json
-        while True:
-            self.sync_positions()  # Sync positions at start of cycle
-            for symbol in symbols:
-                try:
-                    self.process_symbol(symbol)
-                except Exception as e:
-                    logger.log_error(f"Error processing {symbol}: {str(e)[:200]}")
-            
-            # Wait for next 5m candle
-            time.sleep(300 - (time.time() % 300) + 2)  # +2 sec buffer
+        # One shared client/session: the one core.order_executor places orders with
+        self.async_client = async_client
+        await self.async_client.warm()
+        await ws_client.connect()
+        await asyncio.to_thread(warmup_order_kernels)  # JIT before the first order, not during it
+        # Shared client was built in __init__; sync its clock offset before any signed request
+        await asyncio.to_thread(self.utils.sync_time_with_binance)
+        await asyncio.to_thread(symbol_cache.load)  # futures rules once, before any order is sized
+        loop = asyncio.get_running_loop()
+        dispatcher = asyncio.create_task(self.order_queue.run())
+        try:
+            while True:
+                if time.time() - self._last_sync > POS_SYNC_INTERVAL:
+                    # Blocking REST calls run in the default executor, off the event loop
+                    await loop.run_in_executor(None, self.sync_positions)
+                    self._last_sync = time.time()
+
+                # Saturated: no symbol can open a trade, skip all REST work this cycle
+                if self._max_positions_reached():
+                    logger.log_info(f"Max positions ({self.config['max_concurrent_trades']['scalper']}) reached. Skipping cycle")
+                    await self._sleep_until_next_cycle()
+                    continue
+
+                # Health probe (cached for PING_TTL); also keeps the REST connection warm
+                if not await loop.run_in_executor(None, self.utils.ping):
+                    logger.log_warning("Binance ping failed. Skipping cycle")
+                    await self._sleep_until_next_cycle()
+                    continue
+
+                prices = await loop.run_in_executor(None, self.utils.get_all_prices)  # One bulk ticker call per cycle
+                batch = []
+                for symbol in symbols:
+                    if symbol in self.positions:
+                        continue
+                    if prices and symbol not in prices:
+                        logger.log_warning(f"{symbol} missing from bulk ticker snapshot. Skipping")
+                        continue
+                    batch.append(symbol)
+
+                # Fetch/process all symbols concurrently; network waits overlap
+                results = await asyncio.gather(
+                    *(self.process_symbol(symbol, prices.get(symbol)) for symbol in batch),
+                    return_exceptions=True,
+                )
+                for symbol, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logger.log_error(f"Error processing {symbol}: {str(result)[:200]}")
+
+                # Wait for next 5m candle
+                await self._sleep_until_next_cycle()
+        finally:
+            dispatcher.cancel()
+            await ws_client.close()
+            await self.async_client.close()
+
+    async def _sleep_until_next_cycle(self):
+        """Sleep to the next 5m boundary (+2s buffer) on a fixed schedule, so overruns don't drift."""
+        now = time.time()
+        self._next_wake = (int(now) // 300 + 1) * 300 + 2
+        await asyncio.sleep(self._next_wake - now)
 
-    def process_symbol(self, symbol: str):
+    def _max_positions_reached(self) -> bool:
+        return len(self.positions) >= self.config['max_concurrent_trades']['scalper']
+
+    async def process_symbol(self, symbol: str, price: Optional[float] = None):
         """Full processing pipeline for one symbol."""
         # Check max concurrent trades
-        open_positions = len(self.positions)
-        if open_positions >= self.config['max_concurrent_trades']['scalper']:
+        if self._max_positions_reached():
             logger.log_error(f"Max positions ({self.config['max_concurrent_trades']['scalper']}) reached. Skipping {symbol}")
             return
 
@@ -70,10 +146,21 @@ class BinanceBot:
             logger.log_info(f"{symbol} â�³ Position already open: {self.positions[symbol]['direction']}")
             return
 
-        # 1. Fetch data
-        df = self.utils.fetch_klines(symbol, Client.KLINE_INTERVAL_5MINUTE, 300)
-        if df.empty:
-            return
+        # 1. Fetch data (reuse klines already fetched for this 5m bucket)
+        bucket = int(time.time() // 300)
+        cached = rolling_cache.get(symbol)
+        if cached is not None and cached[0] == bucket:
+            df = arrays_to_dataframe(cached[2])
+        else:
+            # Only the newest candles change between cycles; refresh incrementally
+            klines = await self.async_client.fetch_klines_incremental(
+                symbol, cached[1] if cached else None, Client.KLINE_INTERVAL_5MINUTE, 300
+            )
+            if not klines:
+                return
+            cols = klines_to_arrays(klines)  # cache columns; frame built on demand
+            rolling_cache.set(symbol, (bucket, klines, cols))
+            df = arrays_to_dataframe(cols)
             
         # 2. Generate signal
         signal = generate_binance_signal(symbol, df)
@@ -81,6 +168,11 @@ class BinanceBot:
             if self.config.get('verbose_no_signal', False):
                 logger.log_info(f"{symbol} ðŸ“¡ No signal generated")
             return
+
+        # Other symbols may have filled slots while this one awaited its klines
+        if self._max_positions_reached():
+            logger.log_info(f"{symbol} signal dropped: max positions reached during cycle")
+            return
             
         # 3. Prepare order
         order = self.prepare_order(symbol, signal)
@@ -89,9 +181,9 @@ class BinanceBot:
             
         # 4. Execute (live/dry run)
         if self.config.get('dry_run', True):
-            logger.log_info(f"DRY RUN: Would execute {order}")
+            logger.log_info(f"DRY RUN: Would execute {order} (last price: {price})")
         else:
-            self.execute_order(order)
+            self.queue_order(signal, order)
 
     def prepare_order(self, symbol: str, signal: Dict) -> Optional[Dict]:
         """Create Binance-compatible order."""
@@ -112,6 +204,31 @@ class BinanceBot:
             'timeInForce': 'GTC'
         }
 
+    def queue_order(self, signal: Dict, order: Dict):
+        """Queue a prepared order by its signal's stop distance and hold its slot meanwhile."""
+        side = str(signal['side']).upper()
+        self.order_queue.enqueue(
+            {**signal, 'symbol': order['symbol'], 'side': _SIGNAL_SIDES.get(side, side)}, order
+        )
+        # Counts toward max_concurrent_trades now; execute_order rewrites it once placed
+        self.positions[order['symbol']] = self._position_from_order(order)
+
+    async def _execute_queued(self, order: Dict):
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self.execute_order, order) is None:
+            self.positions.pop(order['symbol'], None)  # release the slot held by queue_order
+
+    @staticmethod
+    def _position_from_order(order: Dict) -> Dict:
+        return {
+            'symbol': order['symbol'],
+            'direction': 'long' if order['side'] == 'BUY' else 'short',
+            'entry_price': order['price'],
+            'size': order['quantity'],
+            'stop_loss': order['stopPrice'],
+            'take_profit': None  # TP not set in order, fetch later if needed
+        }
+
     def execute_order(self, order: Dict):
         """Send order to Binance and update positions."""
         try:
@@ -122,14 +239,7 @@ class BinanceBot:
                 source="SCALPER"
             )
             # Update positions after execution
-            self.positions[order['symbol']] = {
-                'symbol': order['symbol'],
-                'direction': 'long' if order['side'] == 'BUY' else 'short',
-                'entry_price': order['price'],
-                'size': order['quantity'],
-                'stop_loss': order['stopPrice'],
-                'take_profit': None  # TP not set in order, fetch later if needed
-            }
+            self.positions[order['symbol']] = self._position_from_order(order)
             return response
         except Exception as e:
             logger.log_error(f"Order failed: {str(e)[:200]}")
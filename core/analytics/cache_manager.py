@@ -1,17 +1,33 @@
 # core/analytics/cache_manager.py
+import threading
+from collections import OrderedDict
+
 
 class RollingCache:
-    def __init__(self):
-        self.cache = {}
+    """Bounded, thread-safe LRU of per-symbol data (usually DataFrames)."""
+
+    def __init__(self, maxsize: int = 256):
+        self.cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._max = maxsize
 
     def get(self, symbol):
-        return self.cache.get(symbol)
+        with self._lock:
+            value = self.cache.get(symbol)
+            if value is not None:
+                self.cache.move_to_end(symbol)
+            return value
 
     def set(self, symbol, df):
-        self.cache[symbol] = df
+        with self._lock:
+            self.cache[symbol] = df
+            self.cache.move_to_end(symbol)
+            while len(self.cache) > self._max:
+                self.cache.popitem(last=False)
 
     def clear(self):
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
 # Global instance for shared cache
 rolling_cache = RollingCache()
@@ -1,11 +1,22 @@
 # core/analytics/trade_recorder.py
-import os, csv, json, time
+import os, csv, json, time, atexit, threading
 from datetime import datetime
-from typing import Dict, List
+from typing import IO, Dict, List, Tuple
+import numpy as np
 from core.position_manager import position_manager
-from utils.price_fetcher import get_latest_price
+from utils.price_fetcher import get_all_latest_prices
 from core.logger import global_logger as logger
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
+
 ROOT = "logs/trades_archive"
 os.makedirs(ROOT, exist_ok=True)
 
@@ -17,12 +28,44 @@ FILES = {
 }
 
 # ---------- CSV helpers ----------
+# One open handle + DictWriter per file for the process lifetime.
+_writers: Dict[str, Tuple[IO, csv.DictWriter, threading.Lock]] = {}
+_writers_lock = threading.Lock()
+
+def _get_writer(path: str, fieldnames) -> Tuple[IO, csv.DictWriter, threading.Lock]:
+    entry = _writers.get(path)
+    if entry is None:
+        with _writers_lock:
+            entry = _writers.get(path)
+            if entry is None:
+                first = not os.path.isfile(path)
+                f = open(path, "a", newline="", buffering=1)
+                w = csv.DictWriter(f, fieldnames=list(fieldnames))
+                if first: w.writeheader()
+                entry = (f, w, threading.Lock())
+                _writers[path] = entry
+    return entry
+
+def _close_writers():
+    with _writers_lock:
+        for f, _, lock in _writers.values():
+            with lock:
+                try:
+                    f.close()
+                except Exception:
+                    pass
+        _writers.clear()
+
+atexit.register(_close_writers)
+
 def _append_csv(path: str, data: Dict):
     try:
-        first = not os.path.isfile(path)
-        with open(path, "a", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=data.keys())
-            if first: w.writeheader()
+        f, w, lock = _get_writer(path, data.keys())
+        with lock:
+            if w.fieldnames != list(data.keys()):
+                # Row shape changed: keep the old per-row column behaviour
+                w = csv.DictWriter(f, fieldnames=list(data.keys()))
+                _writers[path] = (f, w, lock)
             w.writerow(data)
     except Exception as e:
         logger.log_error(f"❌ Recorder write failed: {e}")
@@ -30,17 +73,30 @@ def _append_csv(path: str, data: Dict):
 def append_trade(row: Dict):      _append_csv(FILES["trades"], row)
 def append_lifecycle(row: Dict):  _append_csv(FILES["lifecycle"], row)
 
+# ---------- Timestamps ----------
+_last_iso = (-1, "")  # (epoch second, ISO string) formatted at most once per second
+
+def _iso_now() -> str:
+    global _last_iso
+    sec = time.time_ns() // 1_000_000_000
+    cached = _last_iso
+    if cached[0] != sec:
+        cached = (sec, datetime.fromtimestamp(sec).isoformat())
+        _last_iso = cached
+    return cached[1]
+
 # ---------- Equity curve ----------
 def _calc_equity() -> float:
-    eq = 0.0
-    for pos in position_manager.get_all_positions().values():
-        price = get_latest_price(pos["symbol"]) or pos["entry_price"]
-        size  = pos["size"]
-        if pos["direction"] == "long":
-            eq += (price - pos["entry_price"]) * size
-        else:
-            eq += (pos["entry_price"] - price) * size
-    return eq
+    positions = list(position_manager.get_all_positions().values())
+    if not positions:
+        return 0.0
+    prices = get_all_latest_prices()  # one REST call for the whole book
+    n = len(positions)
+    entry = np.fromiter((p["entry_price"] for p in positions), float, count=n)
+    size  = np.fromiter((p["size"] for p in positions), float, count=n)
+    price = np.fromiter((prices.get(p["symbol"]) or p["entry_price"] for p in positions), float, count=n)
+    sign  = np.fromiter((1.0 if p["direction"] == "long" else -1.0 for p in positions), float, count=n)
+    return float(((price - entry) * size * sign).sum())
 
 _equity_peak = 0
 def snapshot_equity(tag: str = ""):
@@ -49,22 +105,59 @@ def snapshot_equity(tag: str = ""):
     _equity_peak = max(_equity_peak, eq)
     dd = 0 if _equity_peak == 0 else (eq - _equity_peak) / _equity_peak * 100
     _append_csv(FILES["equity"], {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _iso_now(),
         "tag": tag,
         "equity_usdt": round(eq, 4),
         "drawdown_pct": round(dd, 2)
     })
 
 # ---------- Diagnostics ----------
+# Rejections can fire thousands of times per cycle: buffer lines in memory
+# and let a daemon thread append them to disk in one write.
+DIAG_FLUSH_INTERVAL = 0.5
+_diag_buf: List[bytes] = []
+_diag_lock = threading.Lock()
+_diag_thread = None
+
+def _flush_diagnostics():
+    global _diag_buf
+    with _diag_lock:
+        if not _diag_buf:
+            return
+        buf, _diag_buf = _diag_buf, []
+    try:
+        with open(FILES["diagnostics"], "ab") as f:
+            f.write(b"\n".join(buf) + b"\n")
+    except Exception as e:
+        logger.log_error(f"❌ Diagnostics write failed: {e}")
+
+def _diag_flusher():
+    while True:
+        time.sleep(DIAG_FLUSH_INTERVAL)
+        _flush_diagnostics()
+
+def _ensure_diag_flusher():
+    global _diag_thread
+    if _diag_thread is None:
+        with _diag_lock:
+            if _diag_thread is None:
+                _diag_thread = threading.Thread(target=_diag_flusher, name="diag-flusher", daemon=True)
+                _diag_thread.start()
+
+atexit.register(_flush_diagnostics)
+
 def log_reject(symbol: str, filt: str, **features):
     line = {
-        "ts": datetime.now().isoformat(),
+        "ts": _iso_now(),
         "symbol": symbol,
         "filter": filt,
         **features
     }
     try:
-        with open(FILES["diagnostics"], "a") as f:
-            f.write(json.dumps(line) + "\n")
+        encoded = _dumps(line)
     except Exception as e:
         logger.log_error(f"❌ Diagnostics write failed: {e}")
+        return
+    _ensure_diag_flusher()
+    with _diag_lock:
+        _diag_buf.append(encoded)
@@ -1,46 +1,48 @@
 # core/candle_cache.py
 
+import sys
 from threading import Lock
 from core.logger import global_logger as logger
-from utils.notifier import Notifier
-
-notifier = Notifier()
 
 class CandleCache:
     def __init__(self):
         self.last_seen = {}
         self.lock = Lock()
+        self._key_cache = {}  # (symbol, timeframe) -> interned "SYMBOL|tf"
+
+    def _key(self, symbol: str, timeframe: str) -> str:
+        k = self._key_cache.get((symbol, timeframe))
+        if k is None:
+            k = sys.intern(f"{symbol}|{timeframe}")
+            self._key_cache[(symbol, timeframe)] = k
+        return k
 
     def should_process(self, symbol: str, ts: int, timeframe: str = "1h") -> bool:
         """
         Returns True if this candle timestamp for the given timeframe has not been processed yet.
         """
-        try:
-            key = f"{symbol}|{timeframe}"
-            with self.lock:
-                if self.last_seen.get(key) == ts:
-                    logger.log_debug(f"{symbol} ⏩ Duplicate candle TS {ts} for {timeframe} — skipping.")
-                    return False
-                self.last_seen[key] = ts
-                logger.log_debug(f"{symbol} 🟢 New candle TS {ts} for {timeframe} — processing allowed.")
-                return True
-        except Exception as e:
-            logger.log_error(f"{symbol} ❌ CandleCache error in should_process: {e}")
-            notifier.send_critical(f"{symbol} ❌ CandleCache: Failure in should_process(). Restart or manual check recommended.\nError: {e}")
-            return False  # Safe fallback: don't process to avoid duplication on error
+        key = self._key(symbol, timeframe)
+        # Fast path: dict.get is atomic under the GIL, duplicates never touch the lock
+        if self.last_seen.get(key) == ts:
+            logger.log_debug("%s ⏩ Duplicate candle TS %s for %s — skipping.", symbol, ts, timeframe)
+            return False
+        # Only a new timestamp takes the lock (once per candle), re-checked so two
+        # threads racing on the same candle can't both claim it
+        with self.lock:
+            if self.last_seen.get(key) == ts:
+                logger.log_debug("%s ⏩ Duplicate candle TS %s for %s — skipping.", symbol, ts, timeframe)
+                return False
+            self.last_seen[key] = ts
+        logger.log_debug("%s 🟢 New candle TS %s for %s — processing allowed.", symbol, ts, timeframe)
+        return True
 
     def mark_processed(self, symbol: str, timestamp: int, timeframe: str = "1h"):
         """
         Explicitly marks a candle timestamp as processed for the given timeframe.
         """
-        try:
-            key = f"{symbol}|{timeframe}"
-            with self.lock:
-                self.last_seen[key] = timestamp
-                logger.log_debug(f"{symbol} ✅ Marked TS {timestamp} as processed for {timeframe}.")
-        except Exception as e:
-            logger.log_error(f"{symbol} ❌ CandleCache error in mark_processed: {e}")
-            notifier.send_critical(f"{symbol} ❌ CandleCache: Failure in mark_processed(). Manual check advised.\nError: {e}")
+        key = self._key(symbol, timeframe)
+        self.last_seen[key] = timestamp  # single dict store, atomic under the GIL
+        logger.log_debug("%s ✅ Marked TS %s as processed for %s.", symbol, timestamp, timeframe)
 
 # === Singleton Instance ===
 candle_cache = CandleCache()
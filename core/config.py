@@ -1,22 +1,100 @@
 # core/config.py
 import json
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List, Callable, Mapping
 from core.logger import global_logger as logger
 
 # Global config cache
 _CONFIG: Dict[str, Any] = {}
 
+# Getters memoized with _memo(); reload_config() clears them all
+_MEMOIZED: List[Callable] = []
+
+def _memo(maxsize: Optional[int] = None):
+    """lru_cache a getter that returns an immutable value and register it for reload."""
+    def wrap(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+        _MEMOIZED.append(cached)
+        return cached
+    return wrap
+
+# Callbacks run after reload_config() so modules can re-resolve cached settings
+_RELOAD_HOOKS: List[Callable[[], None]] = []
+
+def on_reload(fn: Callable[[], None]) -> Callable[[], None]:
+    """Register fn to be called after every reload_config(); returns fn."""
+    _RELOAD_HOOKS.append(fn)
+    return fn
+
+# ========================
+# Typed settings snapshot (built once per load)
+# ========================
+
+@dataclass(frozen=True, slots=True)
+class MLSettings:
+    sl_pct: float = 0.006
+    tp_pct: float = 0.012
+    confidence_thresholds: Mapping[str, Mapping[str, float]] = field(
+        default_factory=lambda: {"default": {"long": 0.6, "short": 0.6}}
+    )
+    triple_barrier_config: Mapping[str, Any] = field(
+        default_factory=lambda: {"tp": 0.05, "sl": 0.03, "horizon_bars": 4}
+    )
+
+@dataclass(frozen=True, slots=True)
+class ScalperSettings:
+    settings: Mapping[str, Any] = field(default_factory=lambda: {
+        "use_dynamic_sl_tp": True,
+        "swing_sl_lookback": 5,
+        "min_sl_distance_pct": 0.001,
+        "risk_reward_ratio": 2,
+        "fallback_sl_pct": 0.02,
+        "fallback_tp_pct": 0.04,
+        "enable_stc_confirmation": True
+    })
+
+@dataclass(frozen=True, slots=True)
+class WatchdogSettings:
+    heartbeat_timeout_sec: int = 120
+    poll_interval_sec: int = 30
+    sl_tp_buffer_pct: float = 0.0003
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    ml: MLSettings
+    scalper: ScalperSettings
+    watchdog: WatchdogSettings
+
+def _section(cls, raw: Mapping[str, Any]):
+    """Instantiate a settings class from the keys present in a config section."""
+    return cls(**{f.name: raw[f.name] for f in fields(cls) if f.name in raw})
+
+def _build_settings(cfg: Mapping[str, Any]) -> Settings:
+    return Settings(
+        ml=_section(MLSettings, cfg.get("ml_settings", {})),
+        scalper=ScalperSettings(cfg["scalper_settings"]) if "scalper_settings" in cfg else ScalperSettings(),
+        watchdog=_section(WatchdogSettings, cfg.get("watchdog", {})),
+    )
+
+_SETTINGS: Settings = _build_settings({})
+
+_CONFIG_PATH = Path(__file__).parent.parent / "config" / "config.json"
+_config_mtime: Optional[float] = None  # mtime of the config.json last loaded
+
 def _load_config() -> Dict[str, Any]:
     """Load config.json with proper error handling"""
-    global _CONFIG
+    global _CONFIG, _SETTINGS, _config_mtime
     if not _CONFIG:
         try:
-            config_path = Path(__file__).parent.parent / "config" / "config.json"
+            config_path = _CONFIG_PATH
             
             if not config_path.exists():
                 raise FileNotFoundError(f"Config file not found at {config_path}")
 
+            _config_mtime = config_path.stat().st_mtime
             with open(config_path) as f:
                 _CONFIG = json.load(f)
             logger.log_info(f"✅ Config loaded from {config_path}")
@@ -27,18 +105,18 @@ def _load_config() -> Dict[str, Any]:
         except Exception as e:
             logger.log_error(f"❌ Failed to load config: {e}")
             _CONFIG = {}
+        _SETTINGS = _build_settings(_CONFIG)
     return _CONFIG
 
-# Legacy CONFIG variable for backward compatibility
-CONFIG = _load_config()
-
 # ========================
 # Core Configuration
 # ========================
 
+@_memo()
 def is_dry_run_enabled() -> bool:
     return _load_config().get("dry_run", True)
 
+@_memo()
 def is_live_mode() -> bool:
     return _load_config().get("live_mode", False)
 
@@ -48,44 +126,42 @@ def is_live_mode() -> bool:
 
 def get_confidence_thresholds() -> Dict[str, Dict[str, float]]:
     """Get ML confidence thresholds for all pairs"""
-    return _load_config().get("ml_settings", {}).get("confidence_thresholds", {
-        "default": {"long": 0.6, "short": 0.6}
-    })
+    return _SETTINGS.ml.confidence_thresholds
 
 def get_ml_sl_pct() -> float:
-    return _load_config().get("ml_settings", {}).get("sl_pct", 0.006)
+    return _SETTINGS.ml.sl_pct
 
 def get_ml_tp_pct() -> float:
-    return _load_config().get("ml_settings", {}).get("tp_pct", 0.012)
+    return _SETTINGS.ml.tp_pct
 
 def get_triple_barrier_config() -> Dict[str, Any]:
-    return _load_config().get("ml_settings", {}).get("triple_barrier_config", {
-        "tp": 0.05,
-        "sl": 0.03,
-        "horizon_bars": 4
-    })
+    return _SETTINGS.ml.triple_barrier_config
 
 # ========================
 # Trading Configuration
 # ========================
 
+@_memo(maxsize=512)
 def get_max_concurrent_trades_by_source(source: str) -> int:
     return _load_config().get("max_concurrent_trades", {}).get(source.lower(), 1)
 
+_COOLDOWN_ALIASES = {
+    "5m_scalper": "scalper",
+    "scalper": "scalper",
+    "ml": "ml",
+    "ML": "ml"
+}
+
+@_memo(maxsize=512)
 def get_cooldown_minutes_by_source(source: str) -> int:
     try:
-        alias_map = {
-            "5m_scalper": "scalper",
-            "scalper": "scalper",
-            "ml": "ml",
-            "ML": "ml"
-        }
-        key = alias_map.get(source.lower(), source.lower())
+        key = _COOLDOWN_ALIASES.get(source.lower(), source.lower())
         return _load_config().get("cooldown_minutes", {}).get(key, 10)
     except Exception as e:
         logger.log_error(f"❌ get_cooldown_minutes_by_source failed: {e}")
         return 10
 
+@_memo()
 def get_hold_limit_hours() -> int:
     return _load_config().get("hold_limit_hours", 36)
 
@@ -93,6 +169,7 @@ def get_hold_limit_hours() -> int:
 # Allocation Functions
 # ========================
 
+@_memo(maxsize=512)
 def get_usd_allocation(pair: str, source: str = "ML") -> float:
     """Get USD allocation for a trading pair"""
     pair = pair.upper()
@@ -100,6 +177,7 @@ def get_usd_allocation(pair: str, source: str = "ML") -> float:
         return _load_config().get("usd_allocation_ml", {}).get(pair, 200.0)
     return get_scalper_usd_allocation(pair)
 
+@_memo(maxsize=512)
 def get_scalper_usd_allocation(pair: str) -> float:
     """Get scalper-specific allocation"""
     return _load_config().get("usd_allocation_scalper", {}).get(pair.upper(), 100.0)
@@ -108,6 +186,7 @@ def get_scalper_usd_allocation(pair: str) -> float:
 # SL/TP Configuration
 # ========================
 
+@_memo(maxsize=512)
 def get_scalper_fixed_sl_tp_pct(pair: str) -> Tuple[float, float]:
     """Get fixed SL/TP percentages"""
     group = _load_config().get("scalper_sl_tp_pct", {})
@@ -119,23 +198,17 @@ def get_scalper_fixed_sl_tp_pct(pair: str) -> Tuple[float, float]:
 
 def get_scalper_config() -> Dict[str, Any]:
     """Get dynamic SL/TP settings"""
-    return _load_config().get("scalper_settings", {
-        "use_dynamic_sl_tp": True,
-        "swing_sl_lookback": 5,
-        "min_sl_distance_pct": 0.001,
-        "risk_reward_ratio": 2,
-        "fallback_sl_pct": 0.02,
-        "fallback_tp_pct": 0.04,
-        "enable_stc_confirmation": True
-    })
+    return _SETTINGS.scalper.settings
 
 # ========================
 # Alert Configuration
 # ========================
 
+@_memo()
 def get_discord_webhook() -> Optional[str]:
     return _load_config().get("alerts", {}).get("discord_webhook")
 
+@_memo()
 def get_discord_log_webhook() -> Optional[str]:
     return _load_config().get("alerts", {}).get("discord_log_webhook")
 
@@ -144,16 +217,50 @@ def get_discord_log_webhook() -> Optional[str]:
 # ========================
 
 def get_heartbeat_timeout_sec() -> int:
-    return _load_config().get("watchdog", {}).get("heartbeat_timeout_sec", 120)
+    return _SETTINGS.watchdog.heartbeat_timeout_sec
 
 def get_watchdog_poll_interval_sec() -> int:
-    return _load_config().get("watchdog", {}).get("poll_interval_sec", 30)
+    return _SETTINGS.watchdog.poll_interval_sec
 
 def get_sl_tp_buffer_pct() -> float:
-    return _load_config().get("watchdog", {}).get("sl_tp_buffer_pct", 0.0003)
+    return _SETTINGS.watchdog.sl_tp_buffer_pct
 
 def get_config() -> Dict[str, Any]:
     """Get the full config dictionary"""
     return _load_config()
 
-CONFIG = get_config()
\ No newline at end of file
+def reload_config() -> Dict[str, Any]:
+    """Re-read config.json, update CONFIG in place and drop memoized getter values"""
+    global _CONFIG, _SETTINGS
+    _CONFIG = {}
+    fresh = _load_config()
+    if fresh:
+        _CONFIG_BASE.clear()
+        _CONFIG_BASE.update(fresh)
+    _CONFIG = _CONFIG_BASE  # keep the dict behind CONFIG as the live config
+    _SETTINGS = _build_settings(_CONFIG)
+    for getter in _MEMOIZED:
+        getter.cache_clear()
+    for hook in _RELOAD_HOOKS:
+        try:
+            hook()
+        except Exception as e:
+            logger.log_error(f"❌ Config reload hook {getattr(hook, '__name__', hook)} failed: {e}")
+    return _CONFIG
+
+def reload_config_if_changed() -> bool:
+    """reload_config() if config.json changed since it was last loaded; one stat() otherwise."""
+    try:
+        mtime = _CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return False
+    if mtime == _config_mtime:
+        return False
+    logger.log_info("🔄 config.json changed; reloading")
+    reload_config()
+    return True
+
+# Legacy CONFIG variable for backward compatibility: a read-only view of the
+# loaded config (reload_config() refreshes the dict behind it in place)
+_CONFIG_BASE = get_config()
+CONFIG: Mapping[str, Any] = MappingProxyType(_CONFIG_BASE)
\ No newline at end of file
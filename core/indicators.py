@@ -1,8 +1,139 @@
 # core/indicators.py
 
+import math
 import pandas as pd
 import numpy as np
 from core.logger import global_logger as logger
+from utils.indicator_core import true_range
+
+try:
+    from numba import njit
+except ImportError:  # pure-Python fallback: same kernels, no JIT
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+UT_COLUMNS = ["buy_trailing_stop", "sell_trailing_stop", "buy_signal", "sell_signal"]
+
+@njit(cache=True, nogil=True)
+def _ut_fill(high, low, close, buy_period, sell_period, mult, relax, out):
+    """
+    Fused single pass: true range -> rolling-mean ATR for both periods -> UT Bot
+    trailing stops and signals, written into `out` (n, 4): buy stop, sell stop,
+    buy signal, sell signal.
+    ATR matches calculate_atr (simple mean of the last `period` TRs, NaN until
+    `period` bars exist, NaN while a NaN TR is in the window); it is kept as
+    running sums of the finite TRs plus NaN counts over two TR ring buffers.
+    max/min keep Python's NaN semantics (first argument wins unless the
+    second compares strictly greater/smaller), so fastmath stays off.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+    ring_buy = np.zeros(max(buy_period, 1))
+    ring_sell = np.zeros(max(sell_period, 1))
+    sum_buy = 0.0
+    sum_sell = 0.0
+    nan_buy = 0
+    nan_sell = 0
+
+    # Bar 0: no previous close, TR is just high - low; no stops yet
+    tr = high[0] - low[0]
+    if buy_period >= 1:
+        ring_buy[0] = tr
+        if tr != tr:
+            nan_buy = 1
+        else:
+            sum_buy = tr
+    if sell_period >= 1:
+        ring_sell[0] = tr
+        if tr != tr:
+            nan_sell = 1
+        else:
+            sum_sell = tr
+    out[0, 0] = np.nan
+    out[0, 1] = np.nan
+    out[0, 2] = 0.0
+    out[0, 3] = 0.0
+    prev_buy = np.nan
+    prev_sell = np.nan
+
+    for i in range(1, n):
+        h = high[i]
+        l = low[i]
+        cp = close[i-1]
+        tr = h - l
+        a = abs(h - cp)
+        if a > tr:
+            tr = a
+        a = abs(l - cp)
+        if a > tr:
+            tr = a
+
+        atr_buy = np.nan
+        if buy_period >= 1:
+            k = i % buy_period
+            if i >= buy_period:
+                old = ring_buy[k]
+                if old != old:
+                    nan_buy -= 1
+                else:
+                    sum_buy -= old
+            ring_buy[k] = tr
+            if tr != tr:
+                nan_buy += 1
+            else:
+                sum_buy += tr
+            if i >= buy_period - 1 and nan_buy == 0:
+                atr_buy = sum_buy / buy_period
+        atr_sell = np.nan
+        if sell_period >= 1:
+            k = i % sell_period
+            if i >= sell_period:
+                old = ring_sell[k]
+                if old != old:
+                    nan_sell -= 1
+                else:
+                    sum_sell -= old
+            ring_sell[k] = tr
+            if tr != tr:
+                nan_sell += 1
+            else:
+                sum_sell += tr
+            if i >= sell_period - 1 and nan_sell == 0:
+                atr_sell = sum_sell / sell_period
+
+        # Buy trailing stop (lower)
+        cand = l - atr_buy * mult
+        ref = l if math.isnan(prev_buy) else prev_buy
+        buy = ref if ref > cand else cand
+        # Sell trailing stop (upper)
+        cand = h + atr_sell * mult
+        ref = h if math.isnan(prev_sell) else prev_sell
+        sell = ref if ref < cand else cand
+
+        c = close[i]
+        if relax:
+            buy_sig = 1.0 if c > buy else 0.0
+            sell_sig = 1.0 if c < sell else 0.0
+        else:
+            buy_sig = 1.0 if (c > buy and cp <= prev_buy) else 0.0
+            sell_sig = 1.0 if (c < sell and cp >= prev_sell) else 0.0
+
+        out[i, 0] = buy
+        out[i, 1] = sell
+        out[i, 2] = buy_sig
+        out[i, 3] = sell_sig
+        prev_buy = buy
+        prev_sell = sell
+
+@njit(cache=True, nogil=True)
+def _ut_kernel(high, low, close, buy_period, sell_period, mult, relax):
+    """UT Bot over float64 arrays; returns the (n, 4) output of _ut_fill."""
+    out = np.empty((close.shape[0], 4), dtype=np.float64)
+    _ut_fill(high, low, close, buy_period, sell_period, mult, relax, out)
+    return out
 
 def calculate_ut_signals(df: pd.DataFrame, buy_atr_period: int, sell_atr_period: int, multiplier: float, relax_cross: bool):
     """
@@ -17,51 +148,73 @@ def calculate_ut_signals(df: pd.DataFrame, buy_atr_period: int, sell_atr_period:
         DataFrame with buy/sell trailing stops and signals
     """
     try:
-        df = df.copy()
-        close = df["close"].astype(float)
-        high = df["high"].astype(float)
-        low = df["low"].astype(float)
-
-        # Calculate ATR
-        atr_buy = calculate_atr(df, buy_atr_period)
-        atr_sell = calculate_atr(df, sell_atr_period)
-
-        # Initialize trailing stops and signals
-        buy_trailing_stop = pd.Series(index=df.index, dtype=float)
-        sell_trailing_stop = pd.Series(index=df.index, dtype=float)
-        buy_signal = pd.Series(0, index=df.index, dtype=float)
-        sell_signal = pd.Series(0, index=df.index, dtype=float)
-
-        for i in range(1, len(df)):
-            # Buy trailing stop (lower)
-            buy_trailing_stop.iloc[i] = max(
-                low.iloc[i] - atr_buy.iloc[i] * multiplier,
-                buy_trailing_stop.iloc[i-1] if not pd.isna(buy_trailing_stop.iloc[i-1]) else low.iloc[i]
-            )
-            # Sell trailing stop (upper)
-            sell_trailing_stop.iloc[i] = min(
-                high.iloc[i] + atr_sell.iloc[i] * multiplier,
-                sell_trailing_stop.iloc[i-1] if not pd.isna(sell_trailing_stop.iloc[i-1]) else high.iloc[i]
-            )
-
-            # Signals
-            if relax_cross:
-                buy_signal.iloc[i] = 1 if close.iloc[i] > buy_trailing_stop.iloc[i] else 0
-                sell_signal.iloc[i] = 1 if close.iloc[i] < sell_trailing_stop.iloc[i] else 0
-            else:
-                buy_signal.iloc[i] = 1 if close.iloc[i] > buy_trailing_stop.iloc[i] and close.iloc[i-1] <= buy_trailing_stop.iloc[i-1] else 0
-                sell_signal.iloc[i] = 1 if close.iloc[i] < sell_trailing_stop.iloc[i] and close.iloc[i-1] >= sell_trailing_stop.iloc[i-1] else 0
-
-        return pd.DataFrame({
-            "buy_trailing_stop": buy_trailing_stop,
-            "sell_trailing_stop": sell_trailing_stop,
-            "buy_signal": buy_signal,
-            "sell_signal": sell_signal
-        })
+        # Read-only views of the input columns; df itself is never mutated
+        close = df["close"].to_numpy(dtype=np.float64, copy=False)
+        high = df["high"].to_numpy(dtype=np.float64, copy=False)
+        low = df["low"].to_numpy(dtype=np.float64, copy=False)
+
+        # ATR for both periods is computed inside the kernel's single pass
+        out = _ut_kernel(
+            high,
+            low,
+            close,
+            int(buy_atr_period),
+            int(sell_atr_period),
+            float(multiplier),
+            bool(relax_cross),
+        )
+        return pd.DataFrame(out, index=df.index, columns=UT_COLUMNS)
     except Exception as e:
         logger.log_error(f"❌ Error calculating UT signals: {e}")
         return pd.DataFrame()
 
+@njit(cache=True, nogil=True)
+def _roll_minmax(x, w):
+    """
+    O(n) rolling min/max over window w using monotonic index deques.
+    Leading w-1 values are NaN (matches pandas rolling with min_periods=w).
+    """
+    n = x.shape[0]
+    mn = np.full(n, np.nan)
+    mx = np.full(n, np.nan)
+    if w < 1:
+        return mn, mx
+    qmin = np.empty(n, dtype=np.int64)
+    qmax = np.empty(n, dtype=np.int64)
+    hmin = tmin = 0
+    hmax = tmax = 0
+    for i in range(n):
+        v = x[i]
+        while tmin > hmin and x[qmin[tmin - 1]] >= v:
+            tmin -= 1
+        qmin[tmin] = i
+        tmin += 1
+        while tmax > hmax and x[qmax[tmax - 1]] <= v:
+            tmax -= 1
+        qmax[tmax] = i
+        tmax += 1
+        if qmin[hmin] <= i - w:
+            hmin += 1
+        if qmax[hmax] <= i - w:
+            hmax += 1
+        if i >= w - 1:
+            mn[i] = x[qmin[hmin]]
+            mx[i] = x[qmax[hmax]]
+    return mn, mx
+
+def warmup():
+    """
+    Compile the njit kernels on tiny inputs so the first live candle doesn't pay
+    JIT latency (with cache=True, later restarts load them from __pycache__).
+    """
+    try:
+        x = np.linspace(1.0, 2.0, 32)
+        _ut_kernel(x + 0.5, x - 0.5, x, 3, 5, 2.0, True)
+        _roll_minmax(x, 4)
+        logger.log_debug("Indicator kernels warmed up")
+    except Exception as e:
+        logger.log_warning(f"⚠️ Indicator kernel warmup failed: {e}")
+
 def calculate_atr(df: pd.DataFrame, period: int):
     """
     Calculate Average True Range (ATR).
@@ -71,15 +224,24 @@ def calculate_atr(df: pd.DataFrame, period: int):
     Returns:
         Series with ATR values
     """
-    high = df["high"].astype(float)
-    low = df["low"].astype(float)
-    close = df["close"].astype(float)
-    tr = pd.concat([
-        high - low,
-        (high - close.shift()).abs(),
-        (low - close.shift()).abs()
-    ], axis=1).max(axis=1)
-    return tr.rolling(window=period).mean()
+    tr = true_range(df).to_numpy()
+    n = tr.shape[0]
+    atr = np.full(n, np.nan)
+    if n == 0 or period < 1 or n < period:
+        return pd.Series(atr, index=df.index)
+
+    # Rolling mean via cumulative-sum differences. NaN TRs are summed as 0 and
+    # counted separately, so only windows that hold one are NaN (as with
+    # rolling().mean()) instead of every window after it.
+    nan = np.isnan(tr)
+    csum = np.zeros(n + 1)
+    np.cumsum(np.where(nan, 0.0, tr), out=csum[1:])
+    cnan = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(nan, out=cnan[1:])
+    win = (csum[period:] - csum[:-period]) / period
+    win[cnan[period:] != cnan[:-period]] = np.nan
+    atr[period - 1:] = win
+    return pd.Series(atr, index=df.index)
 
 def calculate_stc(close: pd.Series, fast_length: int, slow_length: int, signal_period: int):
     """
@@ -101,16 +263,17 @@ def calculate_stc(close: pd.Series, fast_length: int, slow_length: int, signal_p
         
         # Normalize MACD to 0-100
         window = max(fast_length, slow_length, signal_period)
-        macd_min = macd.rolling(window=window).min()
-        macd_max = macd.rolling(window=window).max()
-        macd_normalized = 100 * (macd - macd_min) / (macd_max - macd_min + 1e-10)  # Avoid division by zero
+        macd_arr = macd.to_numpy(dtype=np.float64, copy=False)
+        macd_min, macd_max = _roll_minmax(macd_arr, window)
+        macd_normalized = 100.0 * (macd_arr - macd_min) / (macd_max - macd_min + 1e-10)  # Avoid division by zero
         
         # Apply signal EMA
-        stc = macd_normalized.ewm(span=signal_period, adjust=False).mean()
+        stc = pd.Series(macd_normalized, index=close.index).ewm(span=signal_period, adjust=False).mean().to_numpy()
         
         # Ensure STC is within 0-100
-        stc = stc.clip(0, 100).fillna(50)  # Fill NaN with neutral value
-        return stc
+        stc = np.clip(stc, 0.0, 100.0)
+        stc[np.isnan(stc)] = 50.0  # Fill NaN with neutral value
+        return pd.Series(stc, index=close.index)
     except Exception as e:
         logger.log_error(f"❌ Error calculating STC: {e}")
         return pd.Series()
\ No newline at end of file
@@ -10,15 +10,20 @@ Exports:
 
 Features:
  - Rotating file handlers: logs/all.log, logs/info.log, logs/warning.log, logs/error.log
+   (warning/error/trade_executor files are only opened on their first record)
  - Module-specific file: logs/trade_executor.log
  - log_live_feed(msg): writes INFO-level message and also appends to logs/live_feed.log
- - Discord alert handler posts ERROR/CRITICAL messages to Discord (lazy import)
+ - Discord alert handler posts ERROR/CRITICAL messages to Discord (lazy import),
+   off the caller's thread via a bounded queue + QueueListener started on first alert
  - log_once(msg, level='info', key=None, ttl=300) to suppress duplicate messages for a TTL
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 import time
 import traceback
 from typing import Optional
@@ -60,6 +65,32 @@ class ModuleFilter(logging.Filter):
         except Exception:
             return False
 
+class LazyRotatingFileHandler(logging.Handler):
+    """
+    Defers creating (and opening) the underlying RotatingFileHandler until the
+    first record passes this handler's level and filters.
+    """
+    def __init__(self, path: str, level: int = logging.NOTSET, **kwargs):
+        super().__init__(level=level)
+        self.path = path
+        self.kwargs = kwargs
+        self._real: Optional[logging.handlers.RotatingFileHandler] = None
+
+    def emit(self, record: logging.LogRecord):
+        if self._real is None:
+            try:
+                self._real = logging.handlers.RotatingFileHandler(self.path, **self.kwargs)
+                self._real.setFormatter(self.formatter)
+            except Exception:
+                self.handleError(record)
+                return
+        self._real.emit(record)
+
+    def close(self):
+        if self._real is not None:
+            self._real.close()
+        super().close()
+
 def ensure_logs_dir(path: str = "logs"):
     try:
         os.makedirs(path, exist_ok=True)
@@ -107,6 +138,36 @@ class DiscordAlertHandler(logging.Handler):
             except Exception:
                 pass
 
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler over a bounded queue: when full, the oldest pending alert is
+    dropped so a Discord outage can't grow memory. Calls `on_first_emit` once
+    (used to start the QueueListener lazily).
+    """
+    def __init__(self, q: "queue.Queue", on_first_emit=None):
+        super().__init__(q)
+        self._on_first_emit = on_first_emit
+
+    def emit(self, record: logging.LogRecord):
+        cb = self._on_first_emit
+        if cb is not None:
+            self._on_first_emit = None
+            cb()
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+
 # --- Logger implementation --------------------------------------------------
 class BotLogger:
     """
@@ -118,10 +179,22 @@ class BotLogger:
         self._logger.setLevel(logging.DEBUG)
         self._configured = False
 
-        # For log_once dedupe: map key -> expiry_timestamp
+        # For log_once dedupe: map key -> expiry_timestamp (bounded, purged lazily)
         self._recent_once = {}
+        self._recent_once_lock = threading.Lock()
+        self._recent_once_max = 4096
         self._default_once_ttl = 300  # seconds
 
+        # Discord alerts are sent from a QueueListener thread (see configure)
+        self._alert_queue: Optional[queue.Queue] = None
+        self._alert_listener: Optional[logging.handlers.QueueListener] = None
+        self._alert_lock = threading.Lock()
+
+        # live_feed.log: path resolved in configure(), handle kept open after first write
+        self._live_path = os.path.join("logs", "live_feed.log")
+        self._live_fh = None
+        self._live_lock = threading.Lock()
+
         self.configure()
 
     def configure(self):
@@ -138,9 +211,13 @@ class BotLogger:
         max_file_mb = logging_cfg.get("max_file_size_mb", 5)
         backup_count = logging_cfg.get("backup_count", 10)
         logs_path = logging_cfg.get("logs_path", "logs")
+        # logging.level (default DEBUG); raising it lets debug calls short-circuit
+        level = logging_cfg.get("level", "DEBUG")
+        self._logger.setLevel(getattr(logging, str(level).upper(), logging.DEBUG))
 
         ensure_logs_dir(logs_path)
         max_bytes = int(max_file_mb * 1024 * 1024)
+        self._live_path = os.path.join(logs_path, "live_feed.log")
 
         formatter = logging.Formatter(fmt="%(asctime)s [%(levelname)s] - %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 
@@ -167,7 +244,7 @@ class BotLogger:
 
         # warning.log: WARNING only
         warn_file = os.path.join(logs_path, "warning.log")
-        fh_warn = logging.handlers.RotatingFileHandler(warn_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        fh_warn = LazyRotatingFileHandler(warn_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
         fh_warn.setLevel(logging.WARNING)
         fh_warn.addFilter(LevelRangeFilter(min_level=logging.WARNING, max_level=logging.WARNING))
         fh_warn.setFormatter(formatter)
@@ -175,7 +252,7 @@ class BotLogger:
 
         # error.log: ERROR and CRITICAL only
         err_file = os.path.join(logs_path, "error.log")
-        fh_err = logging.handlers.RotatingFileHandler(err_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        fh_err = LazyRotatingFileHandler(err_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
         fh_err.setLevel(logging.ERROR)
         fh_err.addFilter(LevelRangeFilter(min_level=logging.ERROR, max_level=None))
         fh_err.setFormatter(formatter)
@@ -184,7 +261,7 @@ class BotLogger:
         # module-specific log for trade_executor
         try:
             trade_file = os.path.join(logs_path, "trade_executor.log")
-            fh_trade = logging.handlers.RotatingFileHandler(trade_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+            fh_trade = LazyRotatingFileHandler(trade_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
             fh_trade.setLevel(logging.DEBUG)
             fh_trade.addFilter(ModuleFilter("trade_executor"))
             fh_trade.setFormatter(formatter)
@@ -200,16 +277,47 @@ class BotLogger:
             alerts_enabled = bool(top_alerts.get("discord_webhook"))
 
         try:
-            discord_handler = DiscordAlertHandler(enabled=alerts_enabled)
-            discord_handler.setLevel(logging.ERROR)
-            discord_handler.setFormatter(formatter)
-            self._logger.addHandler(discord_handler)
+            if alerts_enabled:
+                discord_handler = DiscordAlertHandler(enabled=True)
+                discord_handler.setLevel(logging.ERROR)
+                discord_handler.setFormatter(formatter)
+                # HTTP post happens on the listener thread; callers only enqueue
+                self._alert_queue = queue.Queue(maxsize=1024)
+                self._alert_listener = logging.handlers.QueueListener(
+                    self._alert_queue, discord_handler, respect_handler_level=True
+                )
+                qh = DropOldestQueueHandler(self._alert_queue, on_first_emit=self.start_logging_queue)
+                qh.setLevel(logging.ERROR)
+                self._logger.addHandler(qh)
         except Exception:
             pass
 
         self._logger.propagate = False
         self._configured = True
 
+    def start_logging_queue(self):
+        """Start the Discord alert listener thread (idempotent; called on first alert)."""
+        with self._alert_lock:
+            listener = self._alert_listener
+            if listener is None or getattr(listener, "_thread", None) is not None:
+                return
+            try:
+                listener.start()
+                atexit.register(self.stop_logging_queue)
+            except Exception:
+                pass
+
+    def stop_logging_queue(self):
+        """Flush pending alerts and stop the listener thread."""
+        with self._alert_lock:
+            listener = self._alert_listener
+            if listener is None or getattr(listener, "_thread", None) is None:
+                return
+            try:
+                listener.stop()
+            except Exception:
+                pass
+
     @property
     def logger(self):
         """Underlying logging.Logger"""
@@ -255,12 +363,15 @@ class BotLogger:
                 ttl = self._default_once_ttl
             dedupe_key = key if key is not None else f"log_once:{msg}"
             now = time.time()
-            expiry = self._recent_once.get(dedupe_key)
-            if expiry and expiry > now:
-                # suppressed
-                return
-            # record new expiry
-            self._recent_once[dedupe_key] = now + float(ttl)
+            with self._recent_once_lock:
+                expiry = self._recent_once.get(dedupe_key)
+                if expiry and expiry > now:
+                    # suppressed
+                    return
+                if len(self._recent_once) >= self._recent_once_max:
+                    self._purge_once(now)
+                # record new expiry
+                self._recent_once[dedupe_key] = now + float(ttl)
 
             # map level to method
             level = (level or "info").lower()
@@ -285,6 +396,16 @@ class BotLogger:
             except Exception:
                 pass
 
+    def _purge_once(self, now: float):
+        """Drop expired log_once keys; if still full, evict the oldest. Caller holds the lock."""
+        recent = self._recent_once
+        for k in [k for k, exp in recent.items() if exp <= now]:
+            del recent[k]
+        overflow = len(recent) - self._recent_once_max + 1
+        if overflow > 0:
+            for k in list(recent)[:overflow]:
+                del recent[k]
+
     # New: log_live_feed for runner and other live-stream messages
     def log_live_feed(self, msg: str, *args, **kwargs):
         """
@@ -306,18 +427,14 @@ class BotLogger:
 
             # Also append to a dedicated live_feed log file for easier tailing.
             try:
-                logs_path = get_config().get("logging", {}).get("logs_path", "logs")
-            except Exception:
-                logs_path = "logs"
-            try:
-                ensure_logs_dir(logs_path)
-                live_file = os.path.join(logs_path, "live_feed.log")
                 # timestamp similar to other logs
                 ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
                 line = f"{ts} [LIVE] - {self._name} - {msg}\n"
-                # append safely
-                with open(live_file, "a", encoding="utf-8") as fh:
-                    fh.write(line)
+                with self._live_lock:
+                    if self._live_fh is None:
+                        self._live_fh = open(self._live_path, "a", encoding="utf-8", buffering=1)
+                        atexit.register(self._close_live_feed)
+                    self._live_fh.write(line)
             except Exception:
                 # swallow any file I/O errors
                 pass
@@ -327,10 +444,34 @@ class BotLogger:
             except Exception:
                 pass
 
+    def _close_live_feed(self):
+        with self._live_lock:
+            if self._live_fh is not None:
+                try:
+                    self._live_fh.close()
+                except Exception:
+                    pass
+                self._live_fh = None
+
 # Wrapper that exposes log_* methods AND forwards unknown attributes to underlying logging.Logger.
 class LoggerWrapper:
     def __init__(self, bot_logger: BotLogger):
         self._bot = bot_logger
+        self.reload()
+
+    def reload(self):
+        """Re-read the effective level; call after changing the logger's level."""
+        self._debug_on = self._bot.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def log_debug_enabled(self) -> bool:
+        """Cached DEBUG check so hot paths can skip building debug messages."""
+        return self._debug_on
+
+    def log_debug_exc(self):
+        """log_debug(traceback.format_exc()), without formatting the traceback when DEBUG is off."""
+        if self._debug_on:
+            self._bot.log_debug(traceback.format_exc())
 
     # explicit wrappers
     def log_debug(self, *a, **k): return self._bot.log_debug(*a, **k)
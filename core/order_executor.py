@@ -3,62 +3,198 @@
 Order executor — minimal edits:
 - trim quantity immediately before any futures_create_order call using get_trimmed_quantity()
 - trim prices with get_trimmed_price() when used as stopPrice
-- minimal other changes; keep public API same.
+- execute_order is a coroutine; execute_orders_batch() overlaps the order
+  round trips of a whole basket on one keep-alive aiohttp session.
+- signatures and hot locals are type-annotated (the njit kernels stay untyped).
 """
 
-import os
+import asyncio
+import math
+import aiohttp
+import numpy as np
+from binance.exceptions import BinanceAPIException
+
+try:
+    from numba import njit
+except ImportError:  # pure-Python fallback: same kernels, no JIT
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 from core.logger import global_logger as logger
-from binance_utils import BinanceUtils
-from core.config import CONFIG
-from core.position_manager import position_manager
+from binance_utils import ORDER_UNKNOWN, AsyncBinanceClient
+from core.config import CONFIG, is_dry_run_enabled, on_reload
+from core.position_manager import PositionRecord, position_manager
+from core.signal import Signal
+from core import symbol_cache
+from core.ws_order_client import WsOrderClient
+
+async_client = AsyncBinanceClient()  # aiohttp session opens lazily inside the running loop
+ws_client = WsOrderClient(async_client)  # orders go over the WS API, REST as fallback
 
-binance_utils = BinanceUtils(api_key=os.getenv("BINANCE_API_KEY"), api_secret=os.getenv("BINANCE_API_SECRET"))
+# Failures handled per order; anything else propagates to the caller's handler
+_SIGNAL_ERRORS = (KeyError, ValueError, TypeError)
+_ORDER_ERRORS = _SIGNAL_ERRORS + (ArithmeticError, BinanceAPIException, aiohttp.ClientError, asyncio.TimeoutError)
+
+# +1 moves a price in the trade's favour for longs, -1 for shorts
+_SIDE_SIGN: Dict[str, float] = {"LONG": 1.0, "SHORT": -1.0}
+_ORDER_SIDE: Dict[str, str] = {"LONG": "BUY", "SHORT": "SELL"}
 
 # symbol precision helpers
 from core.symbol_precision import get_trimmed_quantity, get_trimmed_price
 
-def execute_order(signal):
+@dataclass(frozen=True, slots=True)
+class PTPConfig:
+    enabled: bool = False
+    first_rr: float = 1.0
+    first_size_pct: float = 0.5
+
+
+# Resolved from CONFIG once per (re)load instead of on every order
+_PTP: PTPConfig = PTPConfig()
+_USD_ALLOC: Dict[str, float] = {}
+
+
+@on_reload
+def _reload_config() -> None:
+    """Re-resolve the partial TP settings and USD allocations from CONFIG."""
+    global _PTP, _USD_ALLOC
+    ptp_cfg: Dict[str, Any] = CONFIG.get("scalper_settings", {}).get("partial_tp", {})
+    _PTP = PTPConfig(
+        enabled=bool(ptp_cfg.get("enabled", False)),
+        first_rr=float(ptp_cfg.get("first_rr", 1.0)),
+        first_size_pct=float(ptp_cfg.get("first_size_pct", 0.5)),
+    )
+    _USD_ALLOC = {sym: float(v) for sym, v in CONFIG.get("usd_allocation_scalper", {}).items()}
+
+
+_reload_config()
+
+
+@njit(cache=True, nogil=True)
+def _compute_plan(entry, sl, usd, step, rr_first, sign, ptp_enabled):
+    """
+    (raw qty floored to step, partial TP price or NaN) for one signal.
+    A NaN step means the symbol has no cached rules and sizes to 0.
+    fastmath stays off: NaN is a real value here.
+    """
+    if entry <= 0.0 or step != step:
+        qty = 0.0
+    else:
+        qty = usd / entry
+        if step > 0.0:
+            qty = math.floor(qty / step) * step
+    partial = math.nan
+    if ptp_enabled and sl > 0.0 and entry != sl:
+        partial = entry + sign * abs(entry - sl) * rr_first
+    return qty, partial
+
+
+@njit(cache=True, nogil=True)
+def _compute_plans(entries, sls, usd, steps, rr_first, signs, ptp_enabled, qty_out, partial_out):
+    """_compute_plan over a basket, written into qty_out / partial_out (serial: baskets are small)."""
+    for i in range(entries.shape[0]):
+        qty_out[i], partial_out[i] = _compute_plan(
+            entries[i], sls[i], usd[i], steps[i], rr_first, signs[i], ptp_enabled
+        )
+
+
+def warmup() -> None:
+    """
+    Compile the planning kernels on tiny inputs so the first live order doesn't
+    pay JIT latency on the event loop (cache=True reuses them across restarts).
+    """
+    try:
+        _compute_plan(100.0, 99.0, 50.0, 0.001, 1.0, 1.0, True)
+        x = np.array([100.0, 200.0])
+        _compute_plans(x, x - 1.0, x, np.array([0.001, np.nan]), 1.0, np.array([1.0, -1.0]), True,
+                       np.empty(2), np.empty(2))
+        logger.log_debug("Order planning kernels warmed up")
+    except Exception as e:
+        logger.log_warning("⚠️ Order kernel warmup failed: %s", e)
+
+
+async def execute_order(signal: Union[Signal, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
     Execute a trade order with optional partial TP support.
-    Signal dict must include:
-      symbol, side, entry, sl, tp
+    Takes a Signal; a raw dict (symbol, side, entry, sl, tp) is converted
+    with Signal.from_dict first.
     """
     try:
-        symbol = signal['symbol']
-        side = signal['side'].upper()
-        entry = float(signal['entry'])
-        sl = float(signal.get('sl', 0.0))
-        tp = float(signal.get('tp', 0.0))
-
-        # --- Position sizing (calculate raw qty) ---
-        qty_raw = binance_utils.calculate_quantity(
-            symbol,
-            CONFIG['usd_allocation_scalper'].get(symbol, 50),
-            entry
+        if not isinstance(signal, Signal):
+            signal = Signal.from_dict(signal)
+        symbol: str = signal.symbol
+        side: str = signal.side
+        entry: float = signal.entry
+        sl: float = signal.sl
+        tp: float = signal.tp
+
+        # --- Raw qty and partial TP price (partial size follows the trimmed qty in _submit) ---
+        ptp: PTPConfig = _PTP
+        qty_raw, partial = _compute_plan(
+            entry, sl, _USD_ALLOC.get(symbol, 50.0), symbol_cache.step_size(symbol),
+            ptp.first_rr, _SIDE_SIGN[side], ptp.enabled,
         )
+        partial_tp_price: Optional[float] = None if math.isnan(partial) else partial
+    except _SIGNAL_ERRORS as e:
+        name = signal.symbol if isinstance(signal, Signal) else signal.get('symbol', '?')
+        logger.log_error("❌ Order execution failed for %s: %.200s", name, e)
+        return {"status": "failed", "error": str(e)}
+
+    return await _submit(symbol, side, entry, sl, tp, qty_raw, partial_tp_price)
+
+
+# Final statuses that mean an unconfirmed order never opened anything
+_DEAD_STATUSES = frozenset({"CANCELED", "EXPIRED", "EXPIRED_IN_MATCH", "REJECTED"})
+
+
+async def _confirm_order(symbol: str, client_order_id: str) -> Optional[bool]:
+    """
+    Look up an order whose placement reply never arrived: True if it is live
+    or filled, False if Binance has no such order or it died unfilled, None
+    if the lookup could not tell.
+    """
+    order = await async_client.get_order_async(symbol, client_order_id)
+    if order is None:
+        return None
+    if not order:
+        return False
+    return not (order.get("status") in _DEAD_STATUSES and float(order.get("executedQty") or 0) == 0)
+
+
+def _sync_pending(symbol: str) -> None:
+    """Apply the queued pending record, then let the exchange sync keep or drop it."""
+    position_manager.flush_pending()
+    position_manager.sync_with_binance(symbol)
+
+
+async def _submit(
+    symbol: str,
+    side: str,
+    entry: float,
+    sl: float,
+    tp: float,
+    qty_raw: float,
+    partial_tp_price: Optional[float],
+) -> Optional[Dict[str, Any]]:
+    """Trim, validate and place one planned order, then record the position."""
+    try:
+        partial_enabled: bool = _PTP.enabled
+        first_size_pct: float = _PTP.first_size_pct
 
         # --- Trim quantity using canonical helper (price provided) RIGHT BEFORE using it ---
-        qty = get_trimmed_quantity(symbol, qty_raw, price=entry)
-        logger.log_debug(f"{symbol} qty (raw -> trimmed): {qty_raw} -> {qty}")
+        qty: float = get_trimmed_quantity(symbol, qty_raw, price=entry)
+        logger.log_debug("%s qty (raw -> trimmed): %s -> %s", symbol, qty_raw, qty)
         if qty <= 0:
-            logger.log_error(f"{symbol} ❌ Invalid qty={qty}. Skipping {side}.")
+            logger.log_error("%s ❌ Invalid qty=%s. Skipping %s.", symbol, qty, side)
             return {"status": "failed", "error": "qty_invalid_after_trim"}
 
-        # --- Partial TP config ---
-        ptp_cfg = CONFIG.get("scalper_settings", {}).get("partial_tp", {})
-        partial_enabled = ptp_cfg.get("enabled", False)
-        rr_first = float(ptp_cfg.get("first_rr", 1.0))
-        first_size_pct = float(ptp_cfg.get("first_size_pct", 0.5))
-
-        # --- Calculate partial TP if enabled ---
-        partial_tp_price = None
-        if partial_enabled and sl > 0.0:
-            risk = abs(entry - sl)
-            if risk > 0:
-                if side == "LONG":
-                    partial_tp_price = entry + risk * rr_first
-                else:  # SHORT
-                    partial_tp_price = entry - risk * rr_first
+        # --- Reject locally what Binance would refuse (cached filters, no request) ---
+        if symbol_cache.below_minimums(symbol, qty, entry):
+            logger.log_error("%s ❌ qty=%s @ %s below exchange minimums. Skipping %s.", symbol, qty, entry, side)
+            return {"status": "failed", "error": "below_min_notional"}
 
         # Trim partial_tp_price to tick size when we save it
         if partial_tp_price:
@@ -70,47 +206,107 @@ def execute_order(signal):
         # --- Log execution plan ---
         if partial_enabled and partial_tp_price:
             logger.info(
-                f"{symbol} 🚀 Executing {side} with Partial TP: "
-                f"{first_size_pct*100:.0f}% at {partial_tp_price}, "
-                f"SL={sl}, Final TP={tp}, Trail rest"
+                "%s 🚀 Executing %s with Partial TP: %.0f%% at %s, SL=%s, Final TP=%s, Trail rest",
+                symbol, side, first_size_pct * 100, partial_tp_price, sl, tp,
             )
         else:
             logger.info(
-                f"{symbol} 🚀 Executing {side} full position: qty={qty}, entry={entry}, SL={sl}, TP={tp}"
+                "%s 🚀 Executing %s full position: qty=%s, entry=%s, SL=%s, TP=%s",
+                symbol, side, qty, entry, sl, tp,
             )
 
-        # --- Place order (entry only for now) ---
-        # IMPORTANT: pass the trimmed qty into validate_order / actual place logic
-        if binance_utils.validate_order(symbol, entry, qty):
-            logger.info(f"📡 MARKET {side} order placed for {symbol}: Qty={qty}")
-
-            # Save into position manager (with partial TP metadata if enabled)
-            # Ensure partial_tp_size stored is also trimmed
-            partial_tp_size = None
-            if partial_enabled:
-                try:
-                    partial_tp_size = get_trimmed_quantity(symbol, qty * first_size_pct, price=entry)
-                except Exception:
-                    partial_tp_size = float(qty * first_size_pct)
-
-            position_data = {
-                "symbol": symbol,
-                "direction": side.lower(),
-                "entry_price": entry,
-                "size": qty,
-                "stop_loss": sl,
-                "take_profit": tp,
-                "partial_tp_price": partial_tp_price if partial_enabled else None,
-                "partial_tp_size": partial_tp_size if partial_enabled else None,
-                "trail_remaining": partial_enabled,
-                "confidence": 1.0,
-                "label": "scalper",
-                "source": "order_executor",
-            }
-            position_manager.add_position(symbol, side.lower(), position_data)
-
+        # --- Place order (entry only for now); minimums were checked above against futures rules ---
+        confirmed: Optional[bool] = True
+        if not is_dry_run_enabled():
+            result = await ws_client.place_market(symbol, _ORDER_SIDE[side], qty)
+            if result is None:
+                return {"status": "failed", "error": "order_rejected"}
+            if result.get("status") == ORDER_UNKNOWN:
+                confirmed = await _confirm_order(symbol, result["clientOrderId"])
+                if confirmed is False:
+                    logger.log_error("%s ❌ Unconfirmed %s order %s never opened.", symbol, side, result["clientOrderId"])
+                    return {"status": "failed", "error": "order_rejected"}
+        if confirmed:
+            logger.info("📡 MARKET %s order placed for %s: Qty=%s", side, symbol, qty)
         else:
-            logger.log_error(f"{symbol} ❌ Validation failed for {side} order.")
-    except Exception as e:
-        logger.log_error(f"❌ Order execution failed for {signal.get('symbol','?')}: {str(e)[:200]}")
+            # Outcome still unknown: record it as pending and let the exchange sync settle it
+            logger.log_warning("%s ⚠️ MARKET %s outcome unknown; recording as pending and syncing.", symbol, side)
+
+        direction: str = side.lower()
+
+        # Save into position manager (with partial TP metadata if enabled)
+        # Ensure partial_tp_size stored is also trimmed
+        partial_tp_size: Optional[float] = None
+        if partial_enabled:
+            try:
+                partial_tp_size = get_trimmed_quantity(symbol, qty * first_size_pct, price=entry)
+            except Exception:
+                partial_tp_size = float(qty * first_size_pct)
+
+        position_data = PositionRecord(
+            symbol=symbol,
+            direction=direction,
+            entry_price=entry,
+            size=qty,
+            stop_loss=sl,
+            take_profit=tp,
+            partial_tp_price=partial_tp_price if partial_enabled else None,
+            partial_tp_size=partial_tp_size if partial_enabled else None,
+            trail_remaining=partial_enabled,
+            confidence=1.0,
+            label="scalper",
+            source="order_executor" if confirmed else "order_executor_pending",
+        )
+        position_manager.enqueue(symbol, direction, position_data)
+        if not confirmed:
+            asyncio.get_running_loop().run_in_executor(None, _sync_pending, symbol)
+            return {"status": "pending", "symbol": symbol, "qty": qty}
+        return {"status": "ok", "symbol": symbol, "qty": qty}
+    except _ORDER_ERRORS as e:
+        logger.log_error("❌ Order execution failed for %s: %.200s", symbol, e)
         return {"status": "failed", "error": str(e)}
+
+
+async def execute_orders_batch(
+    signals: List[Union[Signal, Dict[str, Any]]],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Execute a basket of signals concurrently; results come back in input order.
+    Sizing and partial-TP prices for the whole basket are computed as arrays,
+    then each order is trimmed/placed on its own task.
+    """
+    if not signals:
+        return []
+    n: int = len(signals)
+    try:
+        sigs: List[Signal] = [s if isinstance(s, Signal) else Signal.from_dict(s) for s in signals]
+        symbols: List[str] = [s.symbol for s in sigs]
+        sides: List[str] = [s.side for s in sigs]
+        entries = np.fromiter((s.entry for s in sigs), dtype=np.float64, count=n)
+        sls = np.fromiter((s.sl for s in sigs), dtype=np.float64, count=n)
+        tps = np.fromiter((s.tp for s in sigs), dtype=np.float64, count=n)
+        alloc = _USD_ALLOC
+        usd = np.fromiter((alloc.get(sym, 50.0) for sym in symbols), dtype=np.float64, count=n)
+        step = symbol_cache.step_sizes(symbols)
+    except _SIGNAL_ERRORS as e:
+        logger.log_warning("⚠️ Batch planning failed, executing one by one: %s", e)
+        return await asyncio.gather(*(execute_order(s) for s in signals))
+
+    ptp: PTPConfig = _PTP
+    sign = np.fromiter((_SIDE_SIGN[sd] for sd in sides), dtype=np.float64, count=n)
+    qty = np.empty(n)
+    partial = np.empty(n)
+    _compute_plans(entries, sls, usd, step, ptp.first_rr, sign, ptp.enabled, qty, partial)
+
+    entry_l: List[float] = entries.tolist()
+    sl_l: List[float] = sls.tolist()
+    tp_l: List[float] = tps.tolist()
+    qty_l: List[float] = qty.tolist()
+    partial_l: List[float] = partial.tolist()
+    return await asyncio.gather(*(
+        _submit(
+            symbols[i], sides[i], entry_l[i], sl_l[i], tp_l[i], qty_l[i],
+            None if math.isnan(partial_l[i]) else partial_l[i],
+        )
+        for i in range(n)
+    ))
@@ -1,65 +1,134 @@
 # core/order_tracker.py
+import sys
 import threading
 import time
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Mapping, Optional, Dict, Tuple
 
-_ORDER_TRACKER: Dict[str, dict] = {}
-_TRACKER_LOCK = threading.Lock()
+Key = Tuple[str, str]
 
+# Record "timestamp" values are time.time_ns() integers (divide by 1e9 for seconds)
 
-def _key(symbol: str, direction: str) -> str:
-    return f"{symbol.upper()}|{direction.lower()}"
+# Striped: each key lives in one shard and only that shard's lock is taken,
+# so unrelated symbols never contend. _SHARDS must stay a power of two.
+_SHARDS = 32
+_TRACKERS = [dict() for _ in range(_SHARDS)]
+_LOCKS = [threading.Lock() for _ in range(_SHARDS)]
+# Per-shard mutation counters (bumped under the shard lock) for get_all()
+_GENS = [0] * _SHARDS
+
+_snapshot: Mapping[Key, dict] = MappingProxyType({})
+_snapshot_gens: Tuple[int, ...] = (-1,) * _SHARDS
+_snapshot_lock = threading.Lock()
+
+# Normalized, interned components: repeat keys reuse the same str objects
+# (and their cached hashes) instead of formatting a new string per call
+_DIRECTIONS = {"long": "long", "LONG": "long", "Long": "long",
+               "short": "short", "SHORT": "short", "Short": "short"}
+_SYMBOLS: Dict[str, str] = {}
+
+
+def _key(symbol: str, direction: str) -> Key:
+    sym = _SYMBOLS.get(symbol)
+    if sym is None:
+        sym = _SYMBOLS.setdefault(symbol, sys.intern(symbol.upper()))
+    d = _DIRECTIONS.get(direction)
+    if d is None:
+        d = sys.intern(direction.lower())
+    return (sym, d)
+
+
+def _shard(key: Key) -> int:
+    return hash(key) & (_SHARDS - 1)
 
 
 def track_entry(symbol: str, direction: str, order_id: str, source: str) -> None:
-    with _TRACKER_LOCK:
-        _ORDER_TRACKER[_key(symbol, direction)] = {
-            "state": "ENTRY_PENDING",
-            "order_id": order_id,
-            "timestamp": time.time(),
-            "source": source
-        }
+    key = _key(symbol, direction)
+    rec = {
+        "state": "ENTRY_PENDING",
+        "order_id": order_id,
+        "timestamp": time.time_ns(),
+        "source": source
+    }
+    i = _shard(key)
+    with _LOCKS[i]:
+        _TRACKERS[i][key] = rec
+        _GENS[i] += 1
 
 
 def mark_open(symbol: str, direction: str) -> None:
-    with _TRACKER_LOCK:
-        key = _key(symbol, direction)
-        if key in _ORDER_TRACKER:
-            _ORDER_TRACKER[key]["state"] = "OPEN"
-            _ORDER_TRACKER[key]["timestamp"] = time.time()
+    key = _key(symbol, direction)
+    ts = time.time_ns()
+    i = _shard(key)
+    with _LOCKS[i]:
+        rec = _TRACKERS[i].get(key)
+        if rec is not None:
+            rec["state"] = "OPEN"
+            rec["timestamp"] = ts
+            _GENS[i] += 1
 
 
 def mark_exit_pending(symbol: str, direction: str) -> bool:
-    with _TRACKER_LOCK:
-        key = _key(symbol, direction)
-        state = _ORDER_TRACKER.get(key, {}).get("state")
-        if state == "EXIT_PENDING":
-            return False
-        _ORDER_TRACKER[key] = {
-            "state": "EXIT_PENDING",
-            "order_id": None,
-            "timestamp": time.time()
-        }
+    key = _key(symbol, direction)
+    rec = {
+        "state": "EXIT_PENDING",
+        "order_id": None,
+        "timestamp": time.time_ns()
+    }
+    i = _shard(key)
+    with _LOCKS[i]:
+        tracker = _TRACKERS[i]
+        cur = tracker.get(key)
+        if cur is not None:
+            if cur.get("state") == "EXIT_PENDING":
+                return False
+            # keep the entry's lifecycle context across the transition
+            rec["order_id"] = cur.get("order_id")
+            if "source" in cur:
+                rec["source"] = cur["source"]
+        tracker[key] = rec
+        _GENS[i] += 1
         return True
 
 
 def is_exit_pending(symbol: str, direction: str) -> bool:
-    with _TRACKER_LOCK:
-        key = _key(symbol, direction)
-        return _ORDER_TRACKER.get(key, {}).get("state") == "EXIT_PENDING"
+    key = _key(symbol, direction)
+    i = _shard(key)
+    with _LOCKS[i]:
+        return _TRACKERS[i].get(key, {}).get("state") == "EXIT_PENDING"
 
 
 def clear(symbol: str, direction: str) -> None:
-    with _TRACKER_LOCK:
-        key = _key(symbol, direction)
-        _ORDER_TRACKER.pop(key, None)
+    key = _key(symbol, direction)
+    i = _shard(key)
+    with _LOCKS[i]:
+        if _TRACKERS[i].pop(key, None) is not None:
+            _GENS[i] += 1
 
 
 def get_lifecycle_state(symbol: str, direction: str) -> Optional[str]:
-    with _TRACKER_LOCK:
-        return _ORDER_TRACKER.get(_key(symbol, direction), {}).get("state")
-
-
-def get_all() -> Dict[str, dict]:
-    with _TRACKER_LOCK:
-        return dict(_ORDER_TRACKER)
+    key = _key(symbol, direction)
+    i = _shard(key)
+    with _LOCKS[i]:
+        return _TRACKERS[i].get(key, {}).get("state")
+
+
+def get_all() -> Mapping[Key, dict]:
+    """
+    Read-only merged view of every shard. Rebuilt only when some shard has
+    mutated since the last call; otherwise the cached view is returned as is.
+    Each shard is copied consistently, the whole is not atomic.
+    """
+    global _snapshot, _snapshot_gens
+    if tuple(_GENS) == _snapshot_gens:
+        return _snapshot
+    with _snapshot_lock:
+        merged: Dict[Key, dict] = {}
+        gens = []
+        for i in range(_SHARDS):
+            with _LOCKS[i]:
+                merged.update(_TRACKERS[i])
+                gens.append(_GENS[i])
+        _snapshot = MappingProxyType(merged)
+        _snapshot_gens = tuple(gens)
+        return _snapshot
@@ -4,52 +4,229 @@ Position manager module — minimal safe patch to fix partial TP / SL exit issue
 
 Key changes:
  - Always trim executed quantities with get_trimmed_quantity when updating local sizes.
- - Poll order status after creating partial/SL orders to confirm executedQty before updating local state.
+ - Confirm executedQty (user data stream for partials, polling for SL orders) before updating local state.
  - If remainder after partial is below one step (or becomes zero after trimming), treat as fully closed and remove local position.
  - Add better Discord alerts in important branches (failed fills, full-close, simulated dry-run).
  - No deletion of existing public API functions; function names/signatures preserved.
 """
 
+import atexit
 import json
 import os
+import threading
 import time
 import traceback
-from datetime import datetime
-from typing import Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from operator import itemgetter
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
 
 from binance.exceptions import BinanceAPIException
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # positions are written as JSON instead
+    msgpack = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
 # keep existing imports used in your repo
 from utils.exchange import client
 from utils.discord_logger import send_discord_log
 from core.logger import global_logger as logger
-from core.config import get_config
+from core.config import get_config, on_reload
+from core.user_stream import user_stream
+from core import order_tracker
+from binance_utils import next_coid
 
 # symbol precision helpers (canonical)
 from core.symbol_precision import get_trimmed_quantity, get_trimmed_price
 
-POSITIONS_FILE_DEFAULT = "open_positions.json"
+LEGACY_POSITIONS_FILE = "open_positions.json"
+# msgpack gets its own extension so a .json file always holds JSON
+POSITIONS_FILE_DEFAULT = "open_positions.msgpack" if msgpack is not None else LEGACY_POSITIONS_FILE
 BINANCE_MISSING_GRACE_SECONDS = 30  # seconds
 
 # Polling configuration for order confirmation (tweak to taste)
 _ORDER_POLL_INTERVAL = 0.5   # seconds between polls
 _ORDER_POLL_TIMEOUT = 8.0    # seconds total wait for fills before giving up
 _MIN_EXECUTED_TO_ACCEPT = 1e-8  # numerical tolerance to treat executedQty > 0
+_WRITER_BATCH_WINDOW = 0.05  # seconds the position writer waits to coalesce adds/saves
+
+# Position fields coerced to float when loaded from disk
+_NUMERIC_KEYS = frozenset({
+    "entry_price",
+    "stop_loss",
+    "take_profit",
+    "peak_price",
+    "size",
+    "qty",
+    "confidence",
+    "trailing_sl",
+    "partial_tp_price",
+    "partial_tp_size",
+})
+
+# Bits of the per-position flags field in PositionManager._hot
+_PARTIAL_DONE = 1
+_BREAKEVEN = 2
+_TP1_TRIGGERED = 4
+_AWAITING_TRAIL = 8
+
+# (entry, sl, tp, ptp_price, ptp_size, size, direction_int, flags); direction_int is 1 for long
+HotRow = Tuple[Optional[float], Optional[float], Optional[float], Optional[float],
+               Optional[float], Optional[float], int, int]
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=4).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _msgpack_default(o):
+    if hasattr(o, "item"):  # numpy scalar
+        return o.item()
+    raise TypeError(f"cannot serialise {type(o).__name__}")
+
+
+def _encode_positions(obj, path: str) -> bytes:
+    """msgpack for a .msgpack path (smaller, faster to write), else indented JSON."""
+    if msgpack is not None and path.endswith(".msgpack"):
+        return msgpack.packb(obj, use_bin_type=True, default=_msgpack_default)
+    return _dumps(obj)
+
+
+def read_positions_file(path: str) -> Dict[str, Any]:
+    """
+    Decode a positions file in either format. JSON files open with '{' (or
+    whitespace); a msgpack top-level map never starts with those bytes.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    head = raw.lstrip()[:1]
+    if not head:
+        return {}
+    if head == b"{":
+        return _loads(raw)
+    if msgpack is None:
+        raise ValueError(f"{path} is msgpack-encoded but msgpack is not installed")
+    return msgpack.unpackb(raw, raw=False)
 
 
 def _to_float_safe(v):
     """Try to coerce a value to float. Accept numeric string, numpy/pandas scalar, single-element list/tuple.
     Return None when not parseable.
     """
+    t = type(v)
+    if t is float:  # common case once positions are loaded: no try block
+        return v
+    if t is int:
+        return float(v)
+    if t is list or t is tuple:
+        if not v:
+            return None
+        v = v[0]
     try:
-        if isinstance(v, (list, tuple)) and len(v) > 0:
-            v = v[0]
         # bools convert to 1/0 but that's acceptable as a numeric fallback in some contexts.
         return float(v)
     except Exception:
         return None
 
 
+def _hot_row(pos: Dict[str, Any]) -> HotRow:
+    """Coerce the fields the tick loop reads into one flat tuple."""
+    flags = 0
+    if pos.get("partial_tp_done"):
+        flags |= _PARTIAL_DONE
+    if pos.get("breakeven"):
+        flags |= _BREAKEVEN
+    if pos.get("tp1_triggered"):
+        flags |= _TP1_TRIGGERED
+    if pos.get("awaiting_trail_activation"):
+        flags |= _AWAITING_TRAIL
+    return (
+        _to_float_safe(pos.get("entry_price")),
+        _to_float_safe(pos.get("stop_loss")),
+        _to_float_safe(pos.get("take_profit")),
+        _to_float_safe(pos.get("partial_tp_price")),
+        _to_float_safe(pos.get("partial_tp_size")),
+        _to_float_safe(pos.get("size")),
+        1 if pos.get("direction", "long") == "long" else 0,
+        flags,
+    )
+
+
+_strftime = time.strftime
+_gmtime = time.gmtime
+
+
+def _iso_now() -> str:
+    """UTC now as 'YYYY-MM-DDTHH:MM:SS.ffffff', without building a datetime."""
+    t = time.time()
+    return f"{_strftime('%Y-%m-%dT%H:%M:%S', _gmtime(t))}.{int((t % 1) * 1e6):06d}"
+
+
+# Serialises file writes with sync/close read-modify-write windows (re-entrant:
+# sync_with_binance -> close_position). Other processes are kept out by flock.
+_positions_lock = threading.RLock()
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive flock on a sidecar lock file; no-op where fcntl is unavailable."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "w") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+_amt_of = itemgetter("_amt")  # parsed positionAmt cached by sync_with_binance
+
+# futures_position_information() results shared by every sync_with_binance call
+_positions_cache: Dict[str, Any] = {"ts": 0.0, "data": []}
+_positions_cache_lock = threading.Lock()
+
+
+def _cached_position_information(ttl: float) -> list:
+    """Account positions from Binance, served from cache while younger than ttl seconds."""
+    with _positions_cache_lock:  # concurrent callers share one fetch
+        age = time.time() - _positions_cache["ts"]
+        if age < ttl:
+            logger.log_debug("positions cache hit (age %.1fs)", age)
+            return _positions_cache["data"]
+        logger.log_debug("positions cache miss; fetching futures_position_information")
+        data = client.futures_position_information() if client else []
+        _positions_cache["data"] = data
+        _positions_cache["ts"] = time.time()
+        return data
+
+
+def invalidate_positions_cache() -> None:
+    """Force the next sync_with_binance to refetch from the exchange."""
+    with _positions_cache_lock:
+        _positions_cache["ts"] = 0.0
+
+
 def _sum_fills_qty(fills):
     """Return the sum of qty in a fills array (string or numeric qtys)."""
     try:
@@ -70,56 +247,289 @@ def _sum_fills_qty(fills):
         return 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class PositionRecord:
+    """Typed payload for add_position(); stored as a Position once accepted."""
+    symbol: str
+    direction: str
+    entry_price: float
+    size: float
+    stop_loss: float
+    take_profit: float
+    partial_tp_price: Optional[float] = None
+    partial_tp_size: Optional[float] = None
+    trail_remaining: bool = False
+    confidence: float = 1.0
+    label: str = ""
+    source: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+_UNSET: Any = object()  # a Position field the record never had (a missing dict key)
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Position(MutableMapping):
+    """
+    In-memory position. Known fields live in slots, anything else in extras.
+    Keeps the dict protocol callers already use (pos["size"], pos.get(...),
+    update(...)); unset fields read as missing keys. to_dict() at persistence.
+    """
+    symbol: Any = _UNSET
+    direction: Any = _UNSET
+    entry_price: Any = _UNSET
+    stop_loss: Any = _UNSET
+    take_profit: Any = _UNSET
+    peak_price: Any = _UNSET
+    size: Any = _UNSET
+    partial_tp_price: Any = _UNSET
+    partial_tp_size: Any = _UNSET
+    partial_tp_done: Any = _UNSET
+    breakeven: Any = _UNSET
+    breakeven_set_at: Any = _UNSET
+    tp1_triggered: Any = _UNSET
+    awaiting_trail_activation: Any = _UNSET
+    sl_order_id: Any = _UNSET
+    tp_order_id: Any = _UNSET
+    last_partial_order_id: Any = _UNSET
+    last_partial_order_status: Any = _UNSET
+    last_partial_executed_qty: Any = _UNSET
+    last_partial_executed_price: Any = _UNSET
+    extras: Dict[str, Any] = field(default_factory=dict)
+    # bumped when a field _check_sane() reads changes (see __setitem__)
+    _version: int = 0
+    # memoised is_position_sane() result for (_version, manager config generation)
+    _sane: bool = False
+    _sane_key: Tuple[int, int] = (-1, -1)
+
+    @classmethod
+    def from_dict(cls, d: Mapping) -> "Position":
+        pos = cls()
+        for k, v in d.items():
+            pos[k] = v
+        return pos
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: self[k] for k in self}
+
+    def __getitem__(self, k: str) -> Any:
+        if k in _POSITION_FIELDS:
+            v = getattr(self, k)
+            if v is _UNSET:
+                raise KeyError(k)
+            return v
+        return self.extras[k]
+
+    def __setitem__(self, k: str, v: Any) -> None:
+        if k in _SANE_FIELDS:
+            self._version += 1
+        if k in _POSITION_FIELDS:
+            setattr(self, k, v)
+        else:
+            self.extras[k] = v
+
+    def __delitem__(self, k: str) -> None:
+        if k in _SANE_FIELDS:
+            self._version += 1
+        if k in _POSITION_FIELDS:
+            if getattr(self, k) is _UNSET:
+                raise KeyError(k)
+            setattr(self, k, _UNSET)
+        else:
+            del self.extras[k]
+
+    def __iter__(self):
+        for name in _FIELD_ORDER:
+            if getattr(self, name) is not _UNSET:
+                yield name
+        yield from self.extras
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, k: object) -> bool:
+        if k in _POSITION_FIELDS:
+            return getattr(self, k) is not _UNSET
+        return k in self.extras
+
+    def get(self, k: str, default: Any = None) -> Any:
+        if k in _POSITION_FIELDS:
+            v = getattr(self, k)
+            return default if v is _UNSET else v
+        return self.extras.get(k, default)
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """dict.update() straight onto slots/extras, one version bump for the batch."""
+        items = other.items() if isinstance(other, Mapping) else other
+        extras = self.extras
+        checked = False
+        for k, v in items:
+            checked = checked or k in _SANE_FIELDS
+            if k in _POSITION_FIELDS:
+                setattr(self, k, v)
+            else:
+                extras[k] = v
+        for k, v in kwargs.items():
+            checked = checked or k in _SANE_FIELDS
+            if k in _POSITION_FIELDS:
+                setattr(self, k, v)
+            else:
+                extras[k] = v
+        if checked:
+            self._version += 1
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+_FIELD_ORDER = tuple(f.name for f in fields(Position) if f.name != "extras" and not f.name.startswith("_"))
+_POSITION_FIELDS = frozenset(_FIELD_ORDER)
+# keys _check_sane() reads ("qty" lives in extras)
+_SANE_FIELDS = frozenset({
+    "direction", "entry_price", "stop_loss", "take_profit", "size", "qty",
+    "tp1_triggered", "awaiting_trail_activation", "breakeven",
+})
+
+
 class PositionManager:
     def __init__(self, positions_file: str = POSITIONS_FILE_DEFAULT):
         self.positions_file = positions_file
+        # bumped on every config change; invalidates memoised sanity results
+        self._cfg_gen = 0
         self.positions: Dict[str, Any] = self.load_positions()
+        # Hot fields for the tick loop, one HotRow per position key; kept in step
+        # with self.positions by _reindex() so guards never touch the full dict
+        self._hot: Dict[str, HotRow] = {}
+        for key in self.positions:
+            self._reindex(key)
+        # enqueue() -> writer thread; deque append/popleft are atomic, no lock needed
+        self._pending: Deque[Tuple[str, str, Any]] = deque()
+        # save_positions() only marks dirty; the writer thread coalesces disk writes
+        self._dirty = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # peak_price last scheduled for disk, per key (see set_peak_price)
+        self._peak_saved: Dict[str, float] = {}
+        self._refresh_config()
+        on_reload(self._refresh_config)
+        if self._migrated:
+            self._flush_to_disk()  # write the new file now; the legacy one is left as a backup
+
+    def _refresh_config(self) -> None:
+        """Cache the settings read on every tick/sanity check; re-run on config reload."""
+        self._cfg_gen += 1
+        cfg = get_config()
+        scalper_settings = cfg.get("scalper_settings", {}) if isinstance(cfg, dict) else {}
+        try:
+            self._min_sl_pct = float(scalper_settings.get("min_sl_distance_pct", 0.0005))
+            self._fallback_sl_pct = float(scalper_settings.get("fallback_sl_pct", 0.03))
+            self._peak_persist_pct = float(scalper_settings.get("peak_persist_delta_pct", 0.0005))
+            self._positions_cache_ttl = float(scalper_settings.get("position_cache_ttl", 10))
+        except (TypeError, ValueError):
+            self._min_sl_pct = 0.0005
+            self._fallback_sl_pct = 0.03
+            self._peak_persist_pct = 0.0005
+            self._positions_cache_ttl = 10.0
+        self._live_mode = bool(cfg.get("live_mode", False)) if isinstance(cfg, dict) else False
+        # sync_with_binance inputs (note its own 0.02 min-SL default)
+        self._base_pairs = list(cfg.get("base_pairs", [])) if isinstance(cfg, dict) else []
+        try:
+            min_sl_pct = float(scalper_settings.get("min_sl_distance_pct", 0.02))
+            rr_ratio = float(scalper_settings.get("risk_reward_ratio", 2))
+        except (TypeError, ValueError):
+            min_sl_pct, rr_ratio = 0.02, 2.0
+        self._sync_sl_mults = (1 - min_sl_pct, 1 + min_sl_pct)
+        self._sync_tp_mults = (1 + min_sl_pct * rr_ratio, 1 - min_sl_pct * rr_ratio)
 
     def load_positions(self) -> Dict[str, Any]:
-        """Load and coerce numeric fields where possible."""
+        """
+        Load and coerce numeric fields where possible. If positions_file does
+        not exist yet, positions are read once from LEGACY_POSITIONS_FILE.
+        """
+        self._migrated = False
         try:
-            if os.path.exists(self.positions_file):
-                with open(self.positions_file, "r") as f:
-                    data = json.load(f)
+            path = self.positions_file
+            if not os.path.exists(path) and path != LEGACY_POSITIONS_FILE and os.path.exists(LEGACY_POSITIONS_FILE):
+                logger.log_info(f"Migrating positions from {LEGACY_POSITIONS_FILE} to {path}")
+                path = LEGACY_POSITIONS_FILE
+                self._migrated = True
+            if os.path.exists(path):
+                data = read_positions_file(path)
 
                 # Coerce numeric types for stability
                 for key, pos in list(data.items()):
                     if isinstance(pos, dict):
-                        for num_key in [
-                            "entry_price",
-                            "stop_loss",
-                            "take_profit",
-                            "peak_price",
-                            "size",
-                            "qty",
-                            "confidence",
-                            "trailing_sl",
-                            "partial_tp_price",
-                            "partial_tp_size",
-                        ]:
-                            if num_key in pos:
-                                try:
-                                    coerced = _to_float_safe(pos[num_key])
-                                    if coerced is not None:
-                                        pos[num_key] = coerced
-                                except Exception:
-                                    pass
+                        for num_key in pos.keys() & _NUMERIC_KEYS:
+                            v = pos[num_key]
+                            if isinstance(v, float):
+                                continue  # already what we want (orjson yields floats directly)
+                            try:
+                                coerced = _to_float_safe(v)
+                                if coerced is not None:
+                                    pos[num_key] = coerced
+                            except Exception:
+                                pass
+                        if "entry_price" in pos:
+                            data[key] = Position.from_dict(pos)
                 return data
             return {}
         except Exception as e:
             logger.log_error(f"Error loading positions: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
             return {}
 
+    def _reindex(self, key: str) -> None:
+        """Rebuild (or drop) the hot row for key after its position changed."""
+        pos = self.positions.get(key)
+        if isinstance(pos, Position) and "entry_price" in pos:
+            self._hot[key] = _hot_row(pos)
+        else:
+            self._hot.pop(key, None)
+
     def save_positions(self) -> None:
-        try:
-            with open(self.positions_file, "w") as f:
-                json.dump(self.positions, f, indent=4)
-        except Exception as e:
-            logger.log_error(f"Error saving positions: {e}")
-            logger.log_debug(traceback.format_exc())
+        """Schedule a write of all positions; the writer thread persists them shortly."""
+        if self._writer is None:
+            self._start_writer()
+        self._dirty.set()
+
+    def _flush_to_disk(self) -> None:
+        """Write positions atomically: dump to a temp file, then os.replace()."""
+        with _positions_lock, _file_lock(self.positions_file + ".lock"):
+            tmp = self.positions_file + ".tmp"
+            try:
+                data = _encode_positions({
+                    k: v.to_dict() if isinstance(v, Position) else v
+                    for k, v in list(self.positions.items())
+                }, self.positions_file)
+            except RuntimeError:
+                # a position dict changed mid-serialisation; retry on the next pass
+                self._dirty.set()
+                return
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self.positions_file)
+            except Exception as e:
+                logger.log_error(f"Error saving positions: {e}")
+                logger.log_debug_exc()
 
     def is_position_sane(self, pos: Dict[str, Any]) -> bool:
+        """Memoised _check_sane(): recomputed only after a checked field or the config changed."""
+        if isinstance(pos, Position):
+            key = (pos._version, self._cfg_gen)
+            if pos._sane_key == key:
+                return pos._sane
+            pos._sane = self._check_sane(pos)
+            pos._sane_key = key
+            return pos._sane
+        return self._check_sane(pos)
+
+    def _check_sane(self, pos: Dict[str, Any]) -> bool:
         """
         Sanity check: ensure entry_price, stop_loss, take_profit are numeric and ordered properly.
         Uses configured minimum SL distance (min_sl_distance_pct) rather than strict inequality so
@@ -133,12 +543,10 @@ class PositionManager:
         tp1/awaiting_trail flags indicate the SL was intentionally moved to breakeven.
         """
         try:
-            if not isinstance(pos, dict):
+            if not isinstance(pos, Mapping):
                 return False
 
-            config = get_config()
-            scalper_settings = config.get("scalper_settings", {}) if isinstance(config, dict) else {}
-            min_sl_pct = scalper_settings.get("min_sl_distance_pct", 0.0005)
+            min_sl_pct = self._min_sl_pct
 
             direction = pos.get("direction")
             entry = _to_float_safe(pos.get("entry_price"))
@@ -151,21 +559,13 @@ class PositionManager:
             if entry <= 0 or (size is None or size <= 0):
                 return False
 
-            # compute minimum absolute SL distance
-            try:
-                min_sl_abs = abs(entry) * float(min_sl_pct)
-            except Exception:
-                min_sl_abs = abs(entry) * 0.0005
+            # compute minimum absolute SL distance (both floats: _to_float_safe / _refresh_config)
+            min_sl_abs = abs(entry) * min_sl_pct
 
             # determine if breakeven is explicitly allowed for this position
-            try:
-                tp1_triggered = bool(pos.get('tp1_triggered', False))
-                awaiting_trail = bool(pos.get('awaiting_trail_activation', False))
-                breakeven_flag = bool(pos.get('breakeven', False))
-            except Exception:
-                tp1_triggered = False
-                awaiting_trail = False
-                breakeven_flag = False
+            tp1_triggered = bool(pos.get('tp1_triggered', False))
+            awaiting_trail = bool(pos.get('awaiting_trail_activation', False))
+            breakeven_flag = bool(pos.get('breakeven', False))
 
             allow_breakeven = tp1_triggered or awaiting_trail or breakeven_flag
 
@@ -208,16 +608,61 @@ class PositionManager:
 
         except Exception as e:
             logger.log_error(f"is_position_sane error: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
             return False
 
-    def add_position(self, symbol: str, direction: str, position_data: Dict[str, Any]) -> None:
+    def add_position(self, symbol: str, direction: str, position_data: Union[PositionRecord, Dict[str, Any]]) -> None:
+        invalidate_positions_cache()
+        self._add(symbol, direction, position_data)
+        self.save_positions()
+
+    def enqueue(self, symbol: str, direction: str, position_data: Union[PositionRecord, Dict[str, Any]]) -> None:
+        """
+        Non-blocking add_position(): hand the record to the writer thread and return.
+        The writer applies everything queued so far before its next write, so the
+        position becomes visible to get_position() a few milliseconds later.
+        """
+        invalidate_positions_cache()
+        self._pending.append((symbol, direction, position_data))
+        if self._writer is None:
+            self._start_writer()
+        self._dirty.set()
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="position-writer", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush_pending)
+
+    def _writer_loop(self) -> None:
+        while True:
+            self._dirty.wait()
+            time.sleep(_WRITER_BATCH_WINDOW)  # let a burst of updates coalesce into one write
+            self._dirty.clear()
+            self.flush_pending()
+
+    def flush_pending(self) -> None:
+        """Apply queued positions and write everything to disk now."""
+        while True:
+            try:
+                symbol, direction, position_data = self._pending.popleft()
+            except IndexError:  # drained (possibly by a concurrent flush)
+                break
+            self._add(symbol, direction, position_data)
+        self._flush_to_disk()
+
+    def _add(self, symbol: str, direction: str, position_data: Union[PositionRecord, Dict[str, Any]]) -> None:
+        """Validate and store a new position in memory; callers persist."""
         key = f"{symbol}_{direction}"
+        if isinstance(position_data, PositionRecord):
+            position_data = position_data.to_dict()
         try:
             # harmonize naming: prefer 'size' but allow 'qty' input
             if "size" not in position_data and "qty" in position_data:
+                qty = position_data["qty"]
                 try:
-                    position_data["size"] = float(position_data["qty"])
+                    position_data["size"] = qty if isinstance(qty, float) else float(qty)
                 except Exception:
                     position_data["size"] = _to_float_safe(position_data.get("qty"))
 
@@ -228,26 +673,20 @@ class PositionManager:
             if entry is None or entry <= 0 or (size is None or size <= 0):
                 # don't persist invalid live position — create an incomplete marker
                 marker_key = f"{key}_synced_incomplete"
-                self.positions[marker_key] = {
-                    "symbol": symbol,
-                    "direction": direction,
-                    "raw": position_data,
-                    "created_at": datetime.utcnow().isoformat(),
-                    "note": "entry_price or size invalid; manual reconciliation required",
-                }
-                self.save_positions()
+                with _positions_lock:
+                    self.positions[marker_key] = {
+                        "symbol": symbol,
+                        "direction": direction,
+                        "raw": position_data,
+                        "created_at": _iso_now(),
+                        "note": "entry_price or size invalid; manual reconciliation required",
+                    }
                 logger.log_warning(f"{marker_key} created (invalid entry/size). raw entry={position_data.get('entry_price')!r}, size={position_data.get('size')!r}")
                 return
 
             # Enforce minimum SL distance (auto-correct if too close)
-            try:
-                cfg = get_config()
-                scalper_settings = cfg.get("scalper_settings", {}) if isinstance(cfg, dict) else {}
-                min_sl_pct = float(scalper_settings.get("min_sl_distance_pct", 0.0005))
-                fallback_sl_pct = float(scalper_settings.get("fallback_sl_pct", 0.03))
-            except Exception:
-                min_sl_pct = 0.0005
-                fallback_sl_pct = 0.03
+            min_sl_pct = self._min_sl_pct
+            fallback_sl_pct = self._fallback_sl_pct
 
             sl = position_data.get("stop_loss")
             if sl is not None:
@@ -271,12 +710,13 @@ class PositionManager:
                     pass
 
             # Persist valid position
-            self.positions[key] = position_data
-            self.save_positions()
+            with _positions_lock:
+                self.positions[key] = Position.from_dict(position_data)
+                self._reindex(key)
             logger.log_info(f"Added position: {key}")
         except Exception as e:
             logger.log_error(f"add_position failed for {key}: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
 
     def update_position(self, symbol: str, direction: str, updates: Dict[str, Any]) -> None:
         key = f"{symbol}_{direction}"
@@ -289,7 +729,9 @@ class PositionManager:
                 # harmonize qty->size if provided
                 if "qty" in coerced_updates and "size" not in coerced_updates:
                     coerced_updates["size"] = coerced_updates.get("qty")
-                self.positions[key].update(coerced_updates)
+                with _positions_lock:
+                    self.positions[key].update(coerced_updates)
+                    self._reindex(key)
                 self.save_positions()
                 logger.log_info(f"Updated position {key}: {coerced_updates}")
                 return
@@ -299,30 +741,35 @@ class PositionManager:
                 size = coerced_updates.get("size", coerced_updates.get("qty", 0.0))
                 if entry is None or entry <= 0 or (size is None or size <= 0):
                     marker_key = f"{key}_synced_incomplete"
-                    self.positions[marker_key] = {
-                        "symbol": symbol,
-                        "direction": direction,
-                        "raw": coerced_updates,
-                        "created_at": datetime.utcnow().isoformat(),
-                        "note": "update attempted to create position but entry/size invalid",
-                    }
+                    with _positions_lock:
+                        self.positions[marker_key] = {
+                            "symbol": symbol,
+                            "direction": direction,
+                            "raw": coerced_updates,
+                            "created_at": _iso_now(),
+                            "note": "update attempted to create position but entry/size invalid",
+                        }
                     self.save_positions()
                     logger.log_warning(f"{marker_key} created (invalid entry/size via update). {coerced_updates!r}")
                     return
                 # safe to create
-                self.positions[key] = coerced_updates
+                with _positions_lock:
+                    self.positions[key] = Position.from_dict(coerced_updates)
+                    self._reindex(key)
                 self.save_positions()
                 logger.log_info(f"Created position {key} via update_position")
         except Exception as e:
             logger.log_error(f"Failed to update/create position {key}: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
 
     def get_position(self, symbol: str, direction: str) -> Optional[Dict[str, Any]]:
         key = f"{symbol}_{direction}"
         return self.positions.get(key)
 
     def get_all_positions(self) -> Dict[str, Any]:
-        return self.positions
+        """Shallow snapshot, safe to iterate while the writer thread adds positions."""
+        with _positions_lock:
+            return dict(self.positions)
 
     def set_peak_price(self, symbol: str, direction: str, price: float) -> None:
         key = f"{symbol}_{direction}"
@@ -330,37 +777,58 @@ class PositionManager:
         if pos:
             val = _to_float_safe(price)
             if val is not None:
-                pos["peak_price"] = val
-                self.save_positions()
+                with _positions_lock:
+                    pos["peak_price"] = val
+                # Memory always has the latest peak; disk only once it moved
+                # peak_persist_delta_pct past the last peak scheduled for writing
+                saved = self._peak_saved.get(key)
+                if saved is None or abs(val - saved) >= abs(saved) * self._peak_persist_pct:
+                    self._peak_saved[key] = val
+                    self.save_positions()
 
     def remove_position(self, key: str) -> None:
         if key in self.positions:
-            self.positions.pop(key)
+            with _positions_lock:
+                self.positions.pop(key, None)
+                self._hot.pop(key, None)
+                self._peak_saved.pop(key, None)
             self.save_positions()
             logger.log_info(f"Removed position: {key}")
 
     def close_position(self, symbol: str, direction: str) -> bool:
         """
         Close local position record and attempt to cancel associated orders.
-        Emits a debug caller stack so you can identify who requested the close.
+        With DEBUG logging on, emits the caller stack so you can identify who requested the close.
         """
         key = f"{symbol}_{direction}"
-        try:
-            caller_stack = "".join(traceback.format_list(traceback.extract_stack()[-6:-1]))
-            logger.log_warning(f"[DEBUG_CLOSE] close_position called for {key} — caller stack:\n{caller_stack}")
-        except Exception:
-            logger.log_warning(f"[DEBUG_CLOSE] close_position called for {key} — (failed to get stack)")
+        if logger.log_debug_enabled:  # frame walk + source reads; skip outside DEBUG
+            try:
+                caller_stack = "".join(traceback.format_list(traceback.extract_stack()[-6:-1]))
+                logger.log_warning(f"[DEBUG_CLOSE] close_position called for {key} — caller stack:\n{caller_stack}")
+            except Exception:
+                logger.log_warning(f"[DEBUG_CLOSE] close_position called for {key} — (failed to get stack)")
 
         position = self.positions.get(key)
         if not position:
             logger.log_warning(f"No position found for {key}")
             return False
 
-        config = get_config()
-        live_mode = config.get("live_mode", False)
+        live_mode = self._live_mode
         if live_mode:
             try:
-                for order_id_key in ["sl_order_id", "tp_order_id"]:
+                order_id_keys = ("sl_order_id", "tp_order_id")
+                other = "short" if direction == "long" else "long"
+                if (position.get("sl_order_id") and position.get("tp_order_id")
+                        and f"{symbol}_{other}" not in self.positions
+                        and order_tracker.get_lifecycle_state(symbol, other) is None):
+                    # both protective orders and nothing else tracked on the symbol: one round trip
+                    try:
+                        client.futures_cancel_all_open_orders(symbol=symbol)
+                        logger.log_info(f"Cancelled all open orders for {key} (SL {position.get('sl_order_id')}, TP {position.get('tp_order_id')})")
+                        order_id_keys = ()
+                    except Exception as e:
+                        logger.log_warning(f"Batch cancel failed for {key} ({e}); cancelling orders individually")
+                for order_id_key in order_id_keys:
                     order_id = position.get(order_id_key)
                     if order_id:
                         try:
@@ -375,17 +843,21 @@ class PositionManager:
                             logger.log_error(f"Unexpected error cancelling {order_id_key} for {key}: {e}")
             except Exception as e:
                 logger.log_error(f"Unexpected error while cancelling orders for {key}: {e}")
-                logger.log_debug(traceback.format_exc())
+                logger.log_debug_exc()
 
         # finally remove local position
         try:
-            self.positions.pop(key, None)
+            with _positions_lock:
+                self.positions.pop(key, None)
+                self._hot.pop(key, None)
+                self._peak_saved.pop(key, None)
             self.save_positions()
+            invalidate_positions_cache()
             logger.log_info(f"Closed position: {key}")
             return True
         except Exception as e:
             logger.log_error(f"Failed to remove local position {key}: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
             return False
 
     def check_partial_tp(self, symbol: str, direction: str, price: float) -> None:
@@ -410,23 +882,20 @@ class PositionManager:
 
         try:
             key = f"{symbol}_{direction}"
-            position = self.positions.get(key)
-            if not position:
+            hot = self._hot.get(key)
+            if hot is None:
+                return
+            entry, _sl, tp, ptp_price, ptp_size, size, is_long, flags = hot
+            # guard path: already taken or not reached yet -> done, no dict access
+            if flags & _PARTIAL_DONE:
                 return
-
-            # targeted numeric coercion checks
-            ptp_price = _to_float_safe(position.get("partial_tp_price"))
-            ptp_size = _to_float_safe(position.get("partial_tp_size"))
-            entry = _to_float_safe(position.get("entry_price"))
-            tp = _to_float_safe(position.get("take_profit"))
-            size = _to_float_safe(position.get("size"))
 
             if ptp_price is None or ptp_size is None or entry is None or tp is None or size is None:
                 logger.log_debug(f"{key} skipped partial TP: insufficient numeric data (ptp={ptp_price}, ptp_size={ptp_size}, entry={entry}, tp={tp}, size={size})")
                 return
 
             # ensure partial price lies between entry and final TP (basic sanity)
-            if direction == "long":
+            if is_long:
                 if not (entry < ptp_price < tp):
                     logger.log_warning(f"{key} invalid partial_tp_price {ptp_price} not between entry {entry} and tp {tp}; skipping partial TP.")
                     return
@@ -435,12 +904,16 @@ class PositionManager:
                     logger.log_warning(f"{key} invalid partial_tp_price {ptp_price} not between tp {tp} and entry {entry}; skipping partial TP.")
                     return
 
-            reached = (direction == "long" and price >= ptp_price) or (direction == "short" and price <= ptp_price)
-            if not position.get("partial_tp_done", False) and reached:
+            reached = price >= ptp_price if is_long else price <= ptp_price
+            if not reached:
+                return
+            position = self.positions.get(key)
+            if not position:
+                return
+            if not position.get("partial_tp_done", False):
                 logger.log_info(f"{symbol} 🎯 Partial TP triggered at {ptp_price} for target size {ptp_size}")
 
-                config = get_config()
-                live_mode = config.get("live_mode", False)
+                live_mode = self._live_mode
                 if not live_mode:
                     # dry-run behavior: emulate the partial close and mark breakeven
                     executed_sim = get_trimmed_quantity(symbol, float(ptp_size), price=ptp_price)
@@ -451,19 +924,23 @@ class PositionManager:
                         position["last_partial_order_status"] = "FILLED"
                         position["last_partial_executed_qty"] = executed_sim
                         position["partial_tp_done"] = True
+                        self._reindex(key)
                         self.save_positions()
                         self.close_position(symbol, direction)
                         send_discord_log(f"{symbol} (DRY) Partial TP simulated and fully closed: executed={executed_sim}", level="INFO")
                         return
-                    position["last_partial_order_id"] = "DRY_RUN"
-                    position["last_partial_order_status"] = "FILLED"
-                    position["last_partial_executed_qty"] = executed_sim
-                    position["size"] = new_size_sim_trimmed
-                    position["partial_tp_done"] = True
-                    position["tp1_triggered"] = True
-                    position["stop_loss"] = float(entry)
-                    position["breakeven"] = True
-                    position["breakeven_set_at"] = int(time.time())
+                    position.update({
+                        "last_partial_order_id": "DRY_RUN",
+                        "last_partial_order_status": "FILLED",
+                        "last_partial_executed_qty": executed_sim,
+                        "size": new_size_sim_trimmed,
+                        "partial_tp_done": True,
+                        "tp1_triggered": True,
+                        "stop_loss": float(entry),
+                        "breakeven": True,
+                        "breakeven_set_at": int(time.time()),  # persisted: wall-clock seconds
+                    })
+                    self._reindex(key)
                     self.save_positions()
                     send_discord_log(f"{symbol} (DRY) Partial TP simulated: executed={executed_sim}, new_size={new_size_sim_trimmed}", level="INFO")
                     return
@@ -497,11 +974,19 @@ class PositionManager:
                         order_payload.pop("reduceOnly", None)
                         order_payload["positionSide"] = "LONG" if direction == "long" else "SHORT"
 
+                    # Register for the user-data push before placing, keyed by our client order id
+                    coid = next_coid()
+                    order_payload["newClientOrderId"] = coid
+                    user_stream.expect(coid)
+
                     logger.log_info(f"{symbol} [partial_tp] placing MARKET reduceOnly payload: {order_payload}")
-                    resp = client.futures_create_order(**order_payload)
+                    try:
+                        resp = client.futures_create_order(**order_payload)
+                    except Exception:
+                        user_stream.wait(coid, 0)  # drop the registration
+                        raise
                     logger.log_info(f"{symbol} [partial_tp] create response: {resp}")
 
-                    # Poll for executedQty up to timeout
                     order_id = resp.get("orderId") or resp.get("clientOrderId")
                     executed = 0.0
                     last_status = resp.get("status", "UNKNOWN")
@@ -512,22 +997,24 @@ class PositionManager:
                     elif isinstance(resp, dict) and resp.get("fills"):
                         executed = _sum_fills_qty(resp.get("fills"))
 
-                    if order_id:
-                        start_ts = time.time()
-                        while time.time() - start_ts < _ORDER_POLL_TIMEOUT:
-                            try:
-                                o = client.futures_get_order(symbol=symbol, orderId=order_id)
-                                last_status = o.get("status", last_status)
-                                executed = _to_float_safe(o.get("executedQty") or 0.0) or executed
-                                # fallback to fills if executedQty missing
-                                if (not executed or executed <= 0) and o.get("fills"):
-                                    executed = _sum_fills_qty(o.get("fills"))
-                                logger.log_debug(f"{symbol} poll order {order_id} status={last_status} executedQty={executed}")
-                                if executed > _MIN_EXECUTED_TO_ACCEPT or str(last_status).upper() == "FILLED":
-                                    break
-                            except Exception as e:
-                                logger.log_debug(f"{symbol} poll error: {e}")
-                            time.sleep(_ORDER_POLL_INTERVAL)
+                    # Fill confirmation is pushed by the user data stream (ORDER_TRADE_UPDATE)
+                    already_filled = str(last_status).upper() == "FILLED"
+                    update = user_stream.wait(coid, 0 if already_filled else _ORDER_POLL_TIMEOUT)
+                    if update is not None:
+                        last_status = update.get("X", last_status)
+                        executed = _to_float_safe(update.get("z")) or executed
+                        logger.log_debug(f"{symbol} order {order_id} pushed status={last_status} executedQty={executed}")
+                    elif order_id and executed <= _MIN_EXECUTED_TO_ACCEPT:
+                        # stream down or nothing pushed in time: a single REST lookup, no poll loop
+                        try:
+                            o = client.futures_get_order(symbol=symbol, orderId=order_id)
+                            last_status = o.get("status", last_status)
+                            executed = _to_float_safe(o.get("executedQty") or 0.0) or executed
+                            # fallback to fills if executedQty missing
+                            if (not executed or executed <= 0) and o.get("fills"):
+                                executed = _sum_fills_qty(o.get("fills"))
+                        except Exception as e:
+                            logger.log_debug(f"{symbol} order lookup error: {e}")
 
                     executed = float(executed or 0.0)
                     executed_trimmed = get_trimmed_quantity(symbol, executed, price=ptp_price)
@@ -566,25 +1053,27 @@ class PositionManager:
                         position["last_partial_executed_qty"] = executed_trimmed
                         position["last_partial_executed_price"] = None
                         position["partial_tp_done"] = True
+                        self._reindex(key)
                         self.save_positions()
                         self.close_position(symbol, direction)
                         return
 
                     # Otherwise update local position size to new_size_trimmed and mark partial done
-                    position["last_partial_order_id"] = order_id
-                    position["last_partial_order_status"] = str(last_status)
-                    position["last_partial_executed_qty"] = executed_trimmed
-                    position["last_partial_executed_price"] = None
-                    position["size"] = new_size_trimmed
-                    position["partial_tp_done"] = True
-                    position["tp1_triggered"] = True
-                    try:
-                        position["stop_loss"] = float(entry)
-                        position["breakeven"] = True
-                        position["breakeven_set_at"] = int(time.time())
-                    except Exception:
-                        pass
-
+                    position.update({
+                        "last_partial_order_id": order_id,
+                        "last_partial_order_status": str(last_status),
+                        "last_partial_executed_qty": executed_trimmed,
+                        "last_partial_executed_price": None,
+                        "size": new_size_trimmed,
+                        "partial_tp_done": True,
+                        "tp1_triggered": True,
+                        # entry is a float from the hot row, so this can't raise
+                        "stop_loss": float(entry),
+                        "breakeven": True,
+                        "breakeven_set_at": int(time.time()),  # persisted: wall-clock seconds
+                    })
+
+                    self._reindex(key)
                     self.save_positions()
                     send_discord_log(f"{symbol} ✅ Partial TP executed: executed={executed_trimmed}, new_size={new_size_trimmed}", level="INFO")
                     logger.log_info(f"{symbol} Partial-TP processed: executed={executed_trimmed}, new_size={new_size_trimmed}")
@@ -594,11 +1083,11 @@ class PositionManager:
                     send_discord_log(f"{symbol} ❌ Partial TP BinanceAPIException: {e}", level="ERROR")
                 except Exception as e:
                     logger.log_error(f"{symbol} ❌ Partial TP unexpected error: {e}")
-                    logger.log_debug(traceback.format_exc())
+                    logger.log_debug_exc()
                     send_discord_log(f"{symbol} ❌ Partial TP unexpected error: {e}", level="ERROR")
         except Exception as e:
             logger.log_error(f"{symbol} ❌ Partial TP check error: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
 
     def check_stop_loss(self, symbol: str, direction: str, price: float) -> None:
         """
@@ -621,8 +1110,7 @@ class PositionManager:
                 return
 
             logger.log_info(f"{symbol} ⛔ Stop-loss triggered at {sl} — attempting to close remaining size {size}")
-            config = get_config()
-            live_mode = config.get("live_mode", False)
+            live_mode = self._live_mode
             if not live_mode:
                 # simulate close in dry-run
                 pos["last_stop_order_id"] = "DRY_RUN"
@@ -707,7 +1195,7 @@ class PositionManager:
 
             except Exception as e:
                 logger.log_error(f"{symbol} ❌ SL execution failed: {e}")
-                logger.log_debug(traceback.format_exc())
+                logger.log_debug_exc()
                 try:
                     send_discord_log(f"{symbol} ❌ SL execution failed: {e}", level="ERROR")
                 except Exception:
@@ -715,7 +1203,7 @@ class PositionManager:
 
         except Exception as e:
             logger.log_error(f"{symbol} ❌ check_stop_loss error: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_debug_exc()
 
     def sync_with_binance(self, symbol: str = None) -> None:
         """
@@ -723,37 +1211,60 @@ class PositionManager:
         When adding positions found on Binance, skip if Binance 'entryPrice' is 0 or missing.
         When Binance reports missing positions, mark `binance_missing_since` and only
         remove local state after a grace period to avoid race conditions.
+        The exchange is read without holding _positions_lock; changes are staged and
+        applied under the lock in one step, and closes (REST cancels) run after it.
         """
+        changed = False  # any local state touched; saved once at the end
+        # marker records, synced positions, missing_since stamps and closes, applied after the symbol loop
+        pending_adds: List[Tuple[str, dict]] = []
+        pending_synced: List[Tuple[str, str, dict]] = []
+        pending_missing: List[Tuple[str, int]] = []
+        pending_closes: List[Tuple[str, str]] = []
         try:
-            config = get_config()
-            symbols = [symbol] if symbol else config.get("base_pairs", [])
-            scalper_settings = config.get("scalper_settings", {})
-            min_sl_pct = scalper_settings.get("min_sl_distance_pct", 0.02)
-            rr_ratio = scalper_settings.get("risk_reward_ratio", 2)
+            symbols = [symbol] if symbol else self._base_pairs
+            # price multipliers for synced SL/TP, per side (cached by _refresh_config)
+            sl_mult_long, sl_mult_short = self._sync_sl_mults
+            tp_mult_long, tp_mult_short = self._sync_tp_mults
 
             binance_positions = []
             try:
-                if client:
-                    binance_positions = client.futures_position_information()
+                binance_positions = _cached_position_information(self._positions_cache_ttl)
             except Exception:
                 binance_positions = []
 
+            # one pass: group by symbol and parse positionAmt once into p["_amt"]
+            by_symbol: Dict[str, List[dict]] = {}
+            _float = float
+            for p in binance_positions:
+                try:
+                    p["_amt"] = _float(p["positionAmt"])
+                except Exception:  # missing or malformed
+                    p["_amt"] = 0.0
+                by_symbol.setdefault(p.get("symbol"), []).append(p)
+
+            positions = self.positions
+            if not binance_positions and not any(
+                f"{s}_long" in positions or f"{s}_short" in positions for s in symbols
+            ):
+                logger.log_debug("sync: no positions anywhere")
+                return
+
             for sym in symbols:
-                relevant_positions = [p for p in binance_positions if p.get("symbol") == sym]
+                relevant_positions = by_symbol.get(sym, [])
+                if not relevant_positions and f"{sym}_long" not in positions and f"{sym}_short" not in positions:
+                    continue  # flat on both sides, nothing to reconcile
                 synced_positions: Dict[str, Any] = {}
 
                 for p in relevant_positions:
-                    try:
-                        amt = float(p.get("positionAmt", 0.0))
-                    except Exception:
-                        amt = 0.0
+                    amt = p["_amt"]
                     if abs(amt) <= 0:
                         continue
-                    side = "long" if amt > 0 else "short"
+                    side_is_long = amt > 0
+                    side = "long" if side_is_long else "short"
                     key = f"{sym}_{side}"
                     if key not in self.positions:
                         # Guard: ensure entryPrice is valid before creating a local record
-                        entry_price_raw = p.get("entryPrice", None)
+                        entry_price_raw = p.get("entryPrice")
                         try:
                             entry_price = float(entry_price_raw) if entry_price_raw is not None else 0.0
                         except Exception:
@@ -761,23 +1272,23 @@ class PositionManager:
 
                         if not entry_price or entry_price <= 0:
                             logger.log_warning(
-                                f"Binance position {key} has invalid entryPrice={entry_price_raw}. Skipping local add; marking for manual reconciliation."
+                                "Binance position %s has invalid entryPrice=%s. Skipping local add; marking for manual reconciliation.",
+                                key, entry_price_raw,
                             )
-                            self.positions[f"{key}_synced_incomplete"] = {
+                            pending_adds.append((f"{key}_synced_incomplete", {
                                 "symbol": sym,
                                 "direction": side,
                                 "size": abs(amt),
                                 "entryPrice_raw": entry_price_raw,
                                 "source": "binance_sync_incomplete",
-                                "entry_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            }
-                            self.save_positions()
+                                "entry_time": _strftime("%Y-%m-%d %H:%M:%S"),
+                            }))
                             continue
 
-                        sl = entry_price * (1 - min_sl_pct) if side == "long" else entry_price * (1 + min_sl_pct)
-                        tp = entry_price * (1 + min_sl_pct * rr_ratio) if side == "long" else entry_price * (1 - min_sl_pct * rr_ratio)
-                        logger.log_warning(f"Found Binance position {key} not in local state. Syncing with SL: {sl}, TP: {tp}")
-                        self.add_position(
+                        sl = entry_price * (sl_mult_long if side_is_long else sl_mult_short)
+                        tp = entry_price * (tp_mult_long if side_is_long else tp_mult_short)
+                        logger.log_warning("Found Binance position %s not in local state. Syncing with SL: %s, TP: %s", key, sl, tp)
+                        pending_synced.append((
                             sym,
                             side,
                             {
@@ -790,43 +1301,59 @@ class PositionManager:
                                 "confidence": 1.0,
                                 "label": "synced",
                                 "source": "binance_sync",
-                                "entry_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                "entry_time": _strftime("%Y-%m-%d %H:%M:%S"),
                             },
-                        )
-                    synced_positions[f"{sym}_{side}"] = self.positions.get(f"{sym}_{side}")
+                        ))
+                    synced_positions[key] = self.positions.get(key)
 
                 # When remote says there is no position but we have local state, mark missing and remove after grace
                 for direction in ["long", "short"]:
                     key = f"{sym}_{direction}"
                     if key in self.positions:
+                        want_long = direction == "long"
                         position_exists = any(
-                            (p.get("symbol") == sym and
-                             ((direction == "long" and float(p.get("positionAmt", 0.0)) > 0) or
-                              (direction == "short" and float(p.get("positionAmt", 0.0)) < 0))
-                             and abs(float(p.get("positionAmt", 0.0))) > 0)
-                            for p in relevant_positions
+                            (a > 0) == want_long for a in map(_amt_of, relevant_positions) if a
                         )
 
                         if not position_exists:
                             local_pos = self.positions.get(key)
                             now_ts = int(time.time())
-                            missing_since = local_pos.get("binance_missing_since") if isinstance(local_pos, dict) else None
+                            missing_since = local_pos.get("binance_missing_since") if isinstance(local_pos, Mapping) else None
                             if not missing_since:
-                                if isinstance(local_pos, dict):
-                                    local_pos["binance_missing_since"] = now_ts
-                                    self.save_positions()
-                                logger.log_warning(f"No Binance position for {key}. Marked missing_since={now_ts}; will wait {BINANCE_MISSING_GRACE_SECONDS}s before removing.")
+                                if isinstance(local_pos, Mapping):
+                                    pending_missing.append((key, now_ts))
+                                logger.log_warning("No Binance position for %s. Marked missing_since=%d; will wait %ds before removing.", key, now_ts, BINANCE_MISSING_GRACE_SECONDS)
                             else:
                                 if now_ts - missing_since > BINANCE_MISSING_GRACE_SECONDS:
-                                    logger.log_warning(f"No Binance position for {key} for >{BINANCE_MISSING_GRACE_SECONDS}s. Removing local state.")
-                                    self.close_position(sym, direction)
+                                    logger.log_warning("No Binance position for %s for >%ds. Removing local state.", key, BINANCE_MISSING_GRACE_SECONDS)
+                                    pending_closes.append((sym, direction))
                                 else:
-                                    logger.log_debug(f"No Binance position for {key} but within grace ({now_ts - missing_since}s).")
-
-                logger.log_debug(f"Synced positions for {sym}: {synced_positions}")
+                                    logger.log_debug("No Binance position for %s but within grace (%ds).", key, now_ts - missing_since)
+
+                logger.log_debug("Synced positions for %s: %r", sym, synced_positions)
+
+            if pending_adds or pending_synced or pending_missing:
+                with _positions_lock:
+                    self.positions.update(pending_adds)
+                    for sym, side, data in pending_synced:
+                        if f"{sym}_{side}" not in self.positions:  # not added meanwhile
+                            self._add(sym, side, data)
+                    for key, ts in pending_missing:
+                        local_pos = self.positions.get(key)
+                        if isinstance(local_pos, Mapping):
+                            local_pos["binance_missing_since"] = ts
+                changed = True
+
+            # close_position cancels orders over REST and takes the lock only to remove
+            for sym, direction in pending_closes:
+                self.close_position(sym, direction)
         except Exception as e:
-            logger.log_error(f"Unexpected error syncing positions for {symbol or 'all symbols'}: {e}")
-            logger.log_debug(traceback.format_exc())
+            logger.log_error("Unexpected error syncing positions for %s: %s", symbol or "all symbols", e)
+            logger.log_debug_exc()
+        finally:
+            # one save for the whole pass, even if it stopped part-way
+            if changed:
+                self.save_positions()
 
     def _save_positions(self) -> None:
         self.save_positions()
@@ -0,0 +1,30 @@
+# core/signal.py
+"""Typed trade signal, validated once where it enters the order path."""
+
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping
+
+Side = Literal["LONG", "SHORT"]
+
+
+@dataclass(frozen=True, slots=True)
+class Signal:
+    symbol: str
+    side: Side
+    entry: float
+    sl: float = 0.0
+    tp: float = 0.0
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "Signal":
+        """Build from a raw signal dict; raises KeyError/ValueError on malformed input."""
+        side = str(d["side"]).upper()
+        if side not in ("LONG", "SHORT"):
+            raise ValueError(f"unknown side {d['side']!r}")
+        return cls(
+            symbol=d["symbol"],
+            side=side,
+            entry=float(d["entry"]),
+            sl=float(d.get("sl", 0.0)),
+            tp=float(d.get("tp", 0.0)),
+        )
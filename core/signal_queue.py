@@ -0,0 +1,99 @@
+# core/signal_queue.py
+"""
+Priority dispatch for signals that become ready together.
+
+LONG and SHORT signals wait in separate heaps ordered by stop distance
+(abs(entry - sl)), tightest risk first. The worker alternates sides when
+popping and keeps at most MAX_IN_FLIGHT orders outstanding, which stays
+under Binance's 10 orders/sec limit. Each signal may carry a prepared order;
+that order (else the signal) is what the dispatch coroutine receives.
+"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from core.logger import global_logger as logger
+from core.order_executor import execute_order
+from core.signal import Signal
+
+MAX_IN_FLIGHT = 8
+
+# (stop distance, arrival seq, signal, payload to dispatch); seq keeps equal
+# distances FIFO and stops heapq from ever comparing signals
+_Item = Tuple[float, int, Signal, Any]
+
+
+class SignalQueue:
+    def __init__(
+        self,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        dispatch: Callable[[Any], Awaitable[Any]] = execute_order,
+    ):
+        self._long: List[_Item] = []
+        self._short: List[_Item] = []
+        self._seq = itertools.count()
+        self._next_long = True
+        self._max_in_flight = max_in_flight
+        self._dispatch_fn = dispatch
+        # created inside run() so they bind to the running loop
+        self._ready: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def __len__(self) -> int:
+        return len(self._long) + len(self._short)
+
+    def enqueue(self, signal: Union[Signal, Dict[str, Any]], order: Any = None) -> None:
+        """
+        Queue a signal for dispatch; call from the event loop's thread. The
+        signal sets the priority; order, if given, is dispatched in its place.
+        """
+        if not isinstance(signal, Signal):
+            try:
+                signal = Signal.from_dict(signal)
+            except Exception as e:
+                logger.log_error("❌ Dropping malformed signal for %s: %s", signal.get('symbol', '?'), e)
+                return
+        heap = self._long if signal.side == "LONG" else self._short
+        payload = signal if order is None else order
+        heapq.heappush(heap, (abs(signal.entry - signal.sl), next(self._seq), signal, payload))
+        if self._ready is not None:
+            self._ready.set()
+
+    def _pop(self) -> Optional[_Item]:
+        """Tightest signal from the side whose turn it is, else from the other side."""
+        first, second = (self._long, self._short) if self._next_long else (self._short, self._long)
+        heap = first or second
+        if not heap:
+            return None
+        self._next_long = heap is not self._long
+        return heapq.heappop(heap)
+
+    async def run(self) -> None:
+        """Dispatch queued signals until the task is cancelled."""
+        self._ready = asyncio.Event()
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        in_flight: Set[asyncio.Task] = set()
+        while True:
+            item = self._pop()
+            if item is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            await self._slots.acquire()
+            task = asyncio.create_task(self._dispatch(item[2], item[3]))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+    async def _dispatch(self, signal: Signal, payload: Any) -> None:
+        try:
+            await self._dispatch_fn(payload)
+        except Exception:
+            logger.exception("❌ Unhandled error dispatching %s %s", signal.side, signal.symbol)
+        finally:
+            self._slots.release()
+
+
+# Global instance for shared dispatch
+signal_queue = SignalQueue()
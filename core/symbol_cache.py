@@ -0,0 +1,107 @@
+# core/symbol_cache.py
+"""
+Futures trading rules, fetched once.
+
+A single GET /fapi/v1/exchangeInfo fills parallel arrays (STEP, TICK,
+MIN_QTY, MIN_NOTIONAL) addressed through SYMBOL_IDX, so sizing an order is plain
+arithmetic instead of a rules lookup per call. Call load() once at startup
+(off the event loop); the lazy loads in the lookups below are only a fallback
+and back off after a failure instead of retrying on every order.
+"""
+
+import math
+import threading
+import time
+from typing import Dict
+
+import numpy as np
+import requests
+
+from core.logger import global_logger as logger
+
+EXCHANGE_INFO_URL = "https://fapi.binance.com/fapi/v1/exchangeInfo"
+RETRY_BACKOFF_MIN = 5.0  # seconds before retrying a failed load; doubles per failure
+RETRY_BACKOFF_MAX = 300.0
+
+SYMBOL_IDX: Dict[str, int] = {}
+STEP = np.zeros(0)
+TICK = np.zeros(0)
+MIN_QTY = np.zeros(0)
+MIN_NOTIONAL = np.zeros(0)
+
+_lock = threading.Lock()
+_next_retry = 0.0  # time.monotonic() before which a failed load is not retried
+_backoff = RETRY_BACKOFF_MIN
+
+
+def load(force: bool = False) -> int:
+    """
+    Populate the rule arrays; later calls are no-ops unless force=True.
+    After a failure, calls inside the backoff window return 0 without a request.
+    """
+    global STEP, TICK, MIN_QTY, MIN_NOTIONAL, _next_retry, _backoff
+    with _lock:
+        if SYMBOL_IDX and not force:
+            return len(SYMBOL_IDX)
+        if not force and time.monotonic() < _next_retry:
+            return 0
+        try:
+            r = requests.get(EXCHANGE_INFO_URL, timeout=10)
+            r.raise_for_status()
+            symbols = r.json().get("symbols", [])
+        except Exception as e:
+            logger.log_error(f"❌ Failed to load futures exchange info (retry in {_backoff:.0f}s): {e}")
+            _next_retry = time.monotonic() + _backoff
+            _backoff = min(_backoff * 2, RETRY_BACKOFF_MAX)
+            return 0
+        _next_retry, _backoff = 0.0, RETRY_BACKOFF_MIN
+
+        n = len(symbols)
+        step, tick, min_qty, min_notional = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+        idx: Dict[str, int] = {}
+        for i, info in enumerate(symbols):
+            filters = {f.get("filterType"): f for f in info.get("filters", [])}
+            lot = filters.get("LOT_SIZE", {})
+            step[i] = float(lot.get("stepSize", 0.0))
+            min_qty[i] = float(lot.get("minQty", 0.0))
+            tick[i] = float(filters.get("PRICE_FILTER", {}).get("tickSize", 0.0))
+            mn = filters.get("MIN_NOTIONAL", {})
+            min_notional[i] = float(mn.get("notional", mn.get("minNotional", 0.0)))
+            idx[info["symbol"]] = i
+
+        # Arrays first, so a reader that finds a symbol can always index it
+        STEP, TICK, MIN_QTY, MIN_NOTIONAL = step, tick, min_qty, min_notional
+        SYMBOL_IDX.clear()
+        SYMBOL_IDX.update(idx)
+        logger.log_info(f"Loaded futures rules for {n} symbols")
+        return n
+
+
+def below_minimums(symbol: str, qty: float, price: float) -> bool:
+    """True when qty is under minQty or qty*price under minNotional (unknown symbols pass)."""
+    idx = SYMBOL_IDX.get(symbol)
+    if idx is None:
+        return False
+    return qty < MIN_QTY[idx] or qty * price < MIN_NOTIONAL[idx]
+
+
+def step_size(symbol: str) -> float:
+    """STEP for one symbol; NaN if it is unknown even after a (re)load attempt."""
+    idx = SYMBOL_IDX.get(symbol)
+    if idx is None:
+        load()
+        idx = SYMBOL_IDX.get(symbol)
+    return float(STEP[idx]) if idx is not None else math.nan
+
+
+def step_sizes(symbols) -> np.ndarray:
+    """STEP gathered for a list of symbols; NaN where a symbol is unknown."""
+    if any(s not in SYMBOL_IDX for s in symbols):
+        load()
+    idx = np.fromiter((SYMBOL_IDX.get(s, -1) for s in symbols), dtype=np.intp, count=len(symbols))
+    step = STEP
+    if step.size == 0:
+        return np.full(len(symbols), np.nan)
+    out = step[np.maximum(idx, 0)]
+    out[idx < 0] = np.nan
+    return out
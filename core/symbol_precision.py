@@ -21,7 +21,8 @@ import json
 import os
 import math
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, getcontext
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 # keep logs consistent with your logger
 try:
@@ -46,13 +47,24 @@ DEFAULT_MIN_NOTIONAL = 1e-6
 getcontext().prec = 28
 
 
+@lru_cache(maxsize=512)
+def _grid(size: float) -> Tuple[Decimal, Decimal]:
+    """(Decimal size, quantum matching its decimal places) for a step/tick size."""
+    d = Decimal(str(size))
+    places = max(0, -d.as_tuple().exponent)
+    return d, Decimal(10) ** -places
+
+
 class SymbolPrecision:
     def __init__(self, precision_file: Optional[str] = None):
         self.precision_file = precision_file or PRECISION_FILE
         self.data = {}
+        # symbol -> (step_size, tick_size, min_notional), parsed once per symbol
+        self._filters: Dict[str, Tuple[float, float, float]] = {}
         self._load()
 
     def _load(self):
+        self._filters = {}
         try:
             if os.path.exists(self.precision_file):
                 with open(self.precision_file, "r", encoding="utf-8") as f:
@@ -72,8 +84,27 @@ class SymbolPrecision:
         uc = symbol.upper()
         return self.data.get(uc, {})
 
+    def get_filters(self, symbol: str) -> Tuple[float, float, float]:
+        """(step_size, tick_size, min_notional) for symbol; the entry scan runs once per symbol."""
+        f = self._filters.get(symbol)
+        if f is None:
+            f = (self._parse_step_size(symbol), self._parse_tick_size(symbol), self._parse_min_notional(symbol))
+            self._filters[symbol] = f
+        return f
+
     def get_step_size(self, symbol: str) -> float:
         """Return stepSize (quantity precision) for symbol or fallback."""
+        return self.get_filters(symbol)[0]
+
+    def get_tick_size(self, symbol: str) -> float:
+        """Return tick size for price increments."""
+        return self.get_filters(symbol)[1]
+
+    def get_min_notional(self, symbol: str) -> float:
+        """Return minNotional for the symbol or default fallback."""
+        return self.get_filters(symbol)[2]
+
+    def _parse_step_size(self, symbol: str) -> float:
         s = self.get_symbol_entry(symbol)
         try:
             # Accept many possible key names (both camelCase and snake_case)
@@ -89,8 +120,7 @@ class SymbolPrecision:
             pass
         return float(DEFAULT_STEP_SIZE)
 
-    def get_tick_size(self, symbol: str) -> float:
-        """Return tick size for price increments."""
+    def _parse_tick_size(self, symbol: str) -> float:
         s = self.get_symbol_entry(symbol)
         try:
             for k in ("tickSize", "priceTick", "pricePrecision", "tick_size", "price_tick"):
@@ -105,8 +135,7 @@ class SymbolPrecision:
             pass
         return float(DEFAULT_TICK_SIZE)
 
-    def get_min_notional(self, symbol: str) -> float:
-        """Return minNotional for the symbol or default fallback."""
+    def _parse_min_notional(self, symbol: str) -> float:
         s = self.get_symbol_entry(symbol)
         try:
             for k in ("minNotional", "min_notional", "minNot", "min_not"):
@@ -119,15 +148,14 @@ class SymbolPrecision:
     def round_price(self, symbol: str, price: float) -> float:
         """Round price to the tick size (ROUND_DOWN)."""
         try:
-            tick = Decimal(str(self.get_tick_size(symbol)))
+            tick, quantum = _grid(self.get_tick_size(symbol))
             p = Decimal(str(price))
             if tick == 0:
                 return float(p)
             # rounding down to multiple of tick
             quant = (p // tick) * tick
             # quantize to tick decimal places
-            places = max(0, -tick.as_tuple().exponent)
-            quant = quant.quantize(Decimal(10) ** -places)
+            quant = quant.quantize(quantum)
             return float(quant)
         except Exception:
             try:
@@ -138,7 +166,7 @@ class SymbolPrecision:
     def round_quantity_down(self, symbol: str, qty: float) -> float:
         """Round quantity down to the allowed step (stepSize) using FLOOR semantics."""
         try:
-            step = Decimal(str(self.get_step_size(symbol)))
+            step, quantum = _grid(self.get_step_size(symbol))
             q = Decimal(str(qty))
             if step == 0:
                 return float(q)
@@ -149,8 +177,7 @@ class SymbolPrecision:
             if rounded < 0:
                 rounded = Decimal("0")
             # quantize to step decimal places
-            places = max(0, -step.as_tuple().exponent)
-            rounded = rounded.quantize(Decimal(10) ** -places)
+            rounded = rounded.quantize(quantum)
             return float(rounded)
         except Exception:
             try:
@@ -0,0 +1,137 @@
+# core/user_stream.py
+"""
+Futures userData stream: order updates pushed by Binance.
+
+A daemon thread keeps wss://fstream.binance.com/ws/<listenKey> open and
+records every ORDER_TRADE_UPDATE. A caller registers its newClientOrderId
+with expect() before placing the order, then blocks in wait() until the
+order reaches a final status instead of polling futures_get_order.
+"""
+
+import json
+import ssl
+import threading
+import time
+from typing import Dict, Optional
+
+import certifi
+import websocket
+
+from core.logger import global_logger as logger
+from utils.exchange import client
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # stdlib fallback
+    _loads = json.loads
+
+USER_STREAM_URL = "wss://fstream.binance.com/ws/"
+LISTEN_KEY_KEEPALIVE = 30 * 60  # seconds; Binance expires a key after 60 idle minutes
+RECONNECT_DELAY = 5.0
+
+_FINAL_STATUSES = frozenset({"FILLED", "CANCELED", "EXPIRED", "EXPIRED_IN_MATCH", "REJECTED"})
+
+
+class UserDataStream:
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self._events: Dict[str, threading.Event] = {}  # clientOrderId -> set on final status
+        self._updates: Dict[str, dict] = {}  # clientOrderId -> latest order payload ("o")
+        self._listen_key: Optional[str] = None
+        self._started = False
+        self.connected = threading.Event()
+
+    def start(self) -> None:
+        """Start the stream and keepalive threads once; later calls are no-ops."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(target=self._run, name="user-data-stream", daemon=True).start()
+        threading.Thread(target=self._keepalive, name="user-data-keepalive", daemon=True).start()
+
+    def expect(self, client_order_id: str) -> threading.Event:
+        """Register an order before it is placed so its update can't be missed."""
+        self.start()
+        event = threading.Event()
+        with self._lock:
+            self._events[client_order_id] = event
+        return event
+
+    def wait(self, client_order_id: str, timeout: float) -> Optional[dict]:
+        """
+        Block until the order is final or timeout expires, then forget it.
+        Returns the latest pushed order payload (possibly partial), or None if
+        nothing arrived for it.
+        """
+        with self._lock:
+            event = self._events.get(client_order_id)
+        if event is not None:
+            event.wait(timeout)
+        with self._lock:
+            self._events.pop(client_order_id, None)
+            return self._updates.pop(client_order_id, None)
+
+    def _on_message(self, ws, message) -> None:
+        try:
+            msg = _loads(message)
+            if msg.get("e") != "ORDER_TRADE_UPDATE":
+                return
+            order = msg.get("o", {})
+            coid = order.get("c")
+            with self._lock:
+                event = self._events.get(coid)
+                if event is None:
+                    return  # not an order anyone is waiting on
+                self._updates[coid] = order
+            if order.get("X") in _FINAL_STATUSES:
+                event.set()
+        except Exception as e:
+            logger.log_error(f"❌ User stream message error: {e}")
+
+    def _on_open(self, ws) -> None:
+        self.connected.set()
+        logger.log_info("📡 Futures user data stream connected")
+
+    def _on_close(self, ws, close_status_code, close_msg) -> None:
+        self.connected.clear()
+        logger.log_warning(f"📴 Futures user data stream closed ({close_status_code}) — {close_msg}")
+
+    def _on_error(self, ws, error) -> None:
+        logger.log_error(f"❌ Futures user data stream error: {error}")
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._listen_key = self._client.futures_stream_get_listen_key()
+                ws = websocket.WebSocketApp(
+                    USER_STREAM_URL + self._listen_key,
+                    on_message=self._on_message,
+                    on_open=self._on_open,
+                    on_close=self._on_close,
+                    on_error=self._on_error,
+                )
+                ws.run_forever(
+                    ping_interval=30,
+                    ping_timeout=10,
+                    sslopt={"cert_reqs": ssl.CERT_REQUIRED, "ca_certs": certifi.where()},
+                )
+            except Exception as e:
+                logger.log_error(f"❌ Futures user data stream failed: {e}")
+            self.connected.clear()
+            time.sleep(RECONNECT_DELAY)
+
+    def _keepalive(self) -> None:
+        while True:
+            time.sleep(LISTEN_KEY_KEEPALIVE)
+            if not self._listen_key:
+                continue
+            try:
+                self._client.futures_stream_keepalive(listenKey=self._listen_key)
+            except Exception as e:
+                logger.log_warning(f"⚠️ Listen key keepalive failed: {e}")
+
+
+# Global instance for shared use
+user_stream = UserDataStream(client)
@@ -0,0 +1,145 @@
+# core/ws_order_client.py
+"""
+Futures order placement over Binance's WebSocket API.
+
+One authenticated socket (wss://ws-fapi.binance.com/ws-fapi/v1) stays open
+and every order is an `order.place` frame correlated to its response by id,
+so submissions skip per-request TLS and HTTP framing. When the socket can't
+be (re)opened the order goes out over REST instead.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from binance_utils import AsyncBinanceClient, _fmt_decimal, _keyed_hmac, get_default_client, next_coid, unknown_order
+from core.logger import global_logger as logger
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+WS_FAPI_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+RESPONSE_TIMEOUT = 10.0  # seconds to wait for an order.place reply
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class WsOrderClient:
+    def __init__(self, rest: AsyncBinanceClient):
+        # REST fallback; its session (DNS cache, keep-alive) also carries the socket
+        self._rest = rest
+        self._api_key = os.getenv("BINANCE_API_KEY") or ""
+        self._hmac = _keyed_hmac()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}  # request id -> reply future
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_connected(self) -> aiohttp.ClientWebSocketResponse:
+        if self._ws is not None and not self._ws.closed:
+            return self._ws
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._ws is None or self._ws.closed:
+                self._ws = await self._rest.session().ws_connect(WS_FAPI_URL, heartbeat=15)
+                self._reader = asyncio.create_task(self._read_loop(self._ws))
+                logger.log_info("🔌 Order WebSocket connected")
+        return self._ws
+
+    async def connect(self) -> None:
+        """Open the socket ahead of the first order; failures are left to the first order."""
+        try:
+            await self._ensure_connected()
+        except Exception as e:
+            logger.log_warning(f"⚠️ Order WebSocket connect failed: {e}")
+
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        try:
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = _loads(msg.data)
+                fut = self._pending.pop(data.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(data)
+        except Exception as e:
+            logger.log_warning(f"⚠️ Order WebSocket read failed: {e}")
+        finally:
+            # Replies for these ids will never arrive on a new socket
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("order websocket closed"))
+            self._pending.clear()
+
+    def _signed_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add apiKey/timestamp and sign the alphabetically sorted payload."""
+        params["apiKey"] = self._api_key
+        params["timestamp"] = int(time.time() * 1000) - get_default_client().time_offset_ms()
+        params["recvWindow"] = 5000
+        h = self._hmac.copy()
+        h.update("&".join(f"{k}={params[k]}" for k in sorted(params)).encode("utf-8"))
+        params["signature"] = h.hexdigest()
+        return params
+
+    async def place_market(self, symbol: str, side: str, qty: float) -> Optional[dict]:
+        """
+        MARKET order via order.place; REST only if the frame could not be sent.
+        None means rejected; unknown_order(coid) means no reply arrived, so the
+        order may be live and must be reconciled by its newClientOrderId.
+        """
+        coid = next_coid()
+        params = self._signed_params(
+            {
+                "symbol": symbol,
+                "side": side,
+                "type": "MARKET",
+                "quantity": _fmt_decimal(qty),
+                "newClientOrderId": coid,
+            }
+        )
+        req_id = next(self._ids)
+        fut = asyncio.get_running_loop().create_future()
+        try:
+            ws = await self._ensure_connected()
+            self._pending[req_id] = fut
+            await ws.send_str(_dumps({"id": req_id, "method": "order.place", "params": params}))
+        except Exception as e:
+            self._pending.pop(req_id, None)
+            logger.log_warning(f"⚠️ Order WebSocket unavailable ({e}); placing {symbol} over REST")
+            return await self._rest.place_market_async(symbol, side, qty, client_order_id=coid)
+
+        # The frame is out: never resend over REST, the order may already be live
+        try:
+            resp = await asyncio.wait_for(fut, RESPONSE_TIMEOUT)
+        except Exception as e:
+            self._pending.pop(req_id, None)
+            logger.log_error(f"{symbol} ❌ No reply for MARKET {side} (id={req_id}, {coid}): {e}")
+            return unknown_order(coid)
+        if resp.get("status") != 200:
+            err = resp.get("error", {})
+            logger.log_error(f"{symbol} ❌ MARKET {side} rejected: {err.get('code')} {err.get('msg')}")
+            return None
+        return resp.get("result")
+
+    async def close(self) -> None:
+        """Close the socket; the shared session is closed by the REST client's close()."""
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        self._ws = None
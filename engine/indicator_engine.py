@@ -3,6 +3,7 @@
 import pandas as pd
 import numpy as np
 from core.logger import global_logger as logger
+from utils.indicator_core import true_range
 from utils.notifier import Notifier, notifier
 
 def compute_ema(series: pd.Series, period: int) -> pd.Series:
@@ -15,11 +16,7 @@ def compute_atr(df: pd.DataFrame, period: int) -> pd.Series:
     """
     Computes the Average True Range (ATR) over the specified period.
     """
-    high_low = df['high'] - df['low']
-    high_close = (df['high'] - df['close'].shift()).abs()
-    low_close = (df['low'] - df['close'].shift()).abs()
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
+    atr = true_range(df).rolling(window=period).mean()
     return atr
 
 def compute_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -92,11 +89,7 @@ def enrich_indicators(df: pd.DataFrame, dropna: bool = True) -> pd.DataFrame:
         df["volume_ma_5"] = df["volume"].rolling(window=5).mean()
 
         # === ATR (5) ===
-        hl = df["high"] - df["low"]
-        hc = abs(df["high"] - df["close"].shift())
-        lc = abs(df["low"] - df["close"].shift())
-        tr = pd.concat([hl, hc, lc], axis=1).max(axis=1)
-        df["atr_5"] = tr.rolling(window=5).mean()
+        df["atr_5"] = true_range(df).rolling(window=5).mean()
 
         # === Candle structure ===
         df["body_size"] = abs(df["close"] - df["open"])
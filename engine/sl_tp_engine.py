@@ -8,6 +8,7 @@ is equal or too-close to entry (prevents zero-distance SL which caused skipped e
 
 import pandas as pd
 import numpy as np
+from collections.abc import Mapping
 from typing import Tuple, Optional, Union, Any
 from core.logger import global_logger as logger
 # These should exist in your config module (they are used in your codebase)
@@ -200,7 +201,7 @@ def calculate_scalper_trailing_stop(
             from core.position_manager import position_manager
 
             pos = position_manager.get_position(symbol, direction) if direction else None
-            if pos and isinstance(pos, dict):
+            if pos and isinstance(pos, Mapping):
                 # prefer explicit numeric fields; if entry missing allow fallback
                 entry_price_raw = pos.get("entry_price") or pos.get("entryPrice") or pos.get("entry_price_estimated") or None
         except Exception as e:
@@ -15,6 +15,11 @@ from ml_engine.feature_engineering import compute_atr
 from data.atr_cache import atr_cache
 from core.config import CONFIG
 
+try:
+    from orjson import loads as _loads  # C parser for the per-message decode
+except ImportError:  # stdlib fallback
+    _loads = json.loads
+
 # === Init Binance client ===
 client = Client(
     api_key=os.getenv("BINANCE_API_KEY"),
@@ -45,7 +50,7 @@ def on_message(ws, message, on_candle_close):
     update_heartbeat()
     _last_ping = time.time()
     try:
-        msg = json.loads(message)
+        msg = _loads(message)
         kline = msg.get("data", {}).get("k")
         if kline and kline.get("x"):
             symbol = msg["data"]["s"]
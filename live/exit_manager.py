@@ -10,9 +10,12 @@ Defensive features included:
  - Add debug stack trace when close_position is invoked to quickly identify caller.
  - Ensure lifecycle & notifier have fallbacks.
 """
+import atexit
 import os
+import threading
 import time
 import traceback
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -20,7 +23,7 @@ from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
 from core.logger import global_logger as logger
-from core.position_manager import position_manager
+from core.position_manager import position_manager, _iso_now, _positions_lock
 from core import order_tracker
 from core.symbol_precision import get_trimmed_quantity
 from core.config import is_dry_run_enabled
@@ -32,7 +35,7 @@ from scalper.sl_tracker import record_scalper_sl_hit
 from dotenv import load_dotenv
 
 # fallback discord logger (used when notifier fails)
-from utils.discord_logger import send_discord_log
+from utils.discord_logger import queue_discord_log, send_discord_log
 
 load_dotenv()
 
@@ -54,8 +57,35 @@ else:
 
 BINANCE_MISSING_GRACE_SECONDS = int(os.getenv("BINANCE_MISSING_GRACE_SECONDS", "30"))
 
+# Fallback exit rows (used when append_lifecycle fails) go through one long-lived
+# append handle. This is the last-resort record of an exit, so every row is
+# flushed and fsynced before _write_fallback returns.
+FALLBACK_CSV = "trade_exit_fallback.csv"
+_fallback_fp = None
+_fallback_lock = threading.Lock()
+
 
 # ---------- helpers ----------
+def _get_fallback_fp():
+    """Open the fallback CSV once; closed at interpreter exit."""
+    global _fallback_fp
+    if _fallback_fp is None:
+        _fallback_fp = open(FALLBACK_CSV, "a", buffering=1)  # line-buffered
+        atexit.register(_fallback_fp.close)
+    return _fallback_fp
+
+
+def _write_fallback(row: str) -> None:
+    with _fallback_lock:
+        fp = _get_fallback_fp()
+        fp.write(row)
+        fp.flush()
+        try:
+            os.fsync(fp.fileno())
+        except OSError:
+            pass  # e.g. a filesystem without fsync; the row is already flushed to the OS
+
+
 def _to_float_safe(v):
     """Coerce numeric-ish values to float or return None."""
     try:
@@ -78,7 +108,7 @@ def _pos_is_sane(pos: Dict[str, Any]) -> bool:
     Uses configured min_sl_distance_pct so very small rounding differences don't reject positions.
     """
     try:
-        if not isinstance(pos, dict):
+        if not isinstance(pos, Mapping):
             return False
         direction = pos.get("direction")
         entry = _to_float_safe(pos.get("entry_price"))
@@ -227,9 +257,8 @@ def full_exit(symbol: str, direction: str, price: float, reason: str) -> None:
         )
         try:
             pos = position_manager.get_position(symbol, direction)
-            if isinstance(pos, dict) and not pos.get("binance_missing_since"):
-                pos["binance_missing_since"] = int(time.time())
-                position_manager.update_position(symbol, direction, {"binance_missing_since": pos["binance_missing_since"]})
+            if isinstance(pos, Mapping) and not pos.get("binance_missing_since"):
+                position_manager.update_position(symbol, direction, {"binance_missing_since": int(time.time())})
         except Exception as e:
             logger.log_warning(f"{symbol}-{direction} ⚠️ Could not mark binance_missing_since: {e}")
         try:
@@ -301,8 +330,7 @@ def full_exit(symbol: str, direction: str, price: float, reason: str) -> None:
     except Exception:
         try:
             # fallback CSV write
-            with open("trade_exit_fallback.csv", "a") as f:
-                f.write(f"{datetime.utcnow().isoformat()},{symbol},{direction},{reason}_EXIT,{price},{qty},{entry_price},{pnl}\n")
+            _write_fallback(f"{_iso_now()},{symbol},{direction},{reason}_EXIT,{price},{qty},{entry_price},{pnl}\n")
             logger.log_info(f"{symbol} fallback exit row written.")
         except Exception:
             logger.log_debug("Failed to write fallback exit CSV.")
@@ -342,8 +370,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
         # mark missing for manual reconciliation if entry_price invalid
         try:
             if not _to_float_safe(pos.get("entry_price")):
-                pos["binance_missing_since"] = int(time.time())
-                position_manager.update_position(symbol, direction, {"binance_missing_since": pos["binance_missing_since"]})
+                position_manager.update_position(symbol, direction, {"binance_missing_since": int(time.time())})
         except Exception:
             logger.log_debug("Failed to mark binance_missing_since in TP1 sanity fallback.")
         return
@@ -417,8 +444,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
                         )
                     except Exception:
                         try:
-                            with open("trade_exit_fallback.csv", "a") as f:
-                                f.write(f"{datetime.utcnow().isoformat()},{symbol},TP1_EXIT,{price},{executed_qty},{pos.get('entry_price')}\n")
+                            _write_fallback(f"{_iso_now()},{symbol},TP1_EXIT,{price},{executed_qty},{pos.get('entry_price')}\n")
                         except Exception:
                             logger.log_debug("Fallback write failed for TP1 remaining-close.")
 
@@ -426,10 +452,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
                     try:
                         notifier.send_info(f"{symbol} 🎯 Partial TP filled (remaining-close): closed {executed_qty} @ {price:.6f}")
                     except Exception:
-                        try:
-                            send_discord_log(f"{symbol} 🎯 Partial TP filled (remaining-close): closed {executed_qty} @ {price:.6f}")
-                        except Exception:
-                            logger.log_debug("Notifier & discord failed for TP1 remaining-close.")
+                        queue_discord_log(symbol, f"{symbol} 🎯 Partial TP filled (remaining-close): closed {executed_qty} @ {price:.6f}")
 
                     if new_size <= 0:
                         position_manager.close_position(symbol, direction)
@@ -439,7 +462,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
                     logger.log_info(f"{symbol} No remaining position on Binance after TP1 rounding. Marking missing.")
                     try:
                         pos_local = position_manager.get_position(symbol, direction)
-                        if isinstance(pos_local, dict):
+                        if isinstance(pos_local, Mapping):
                             pos_local["binance_missing_since"] = int(time.time())
                             position_manager.update_position(symbol, direction, {"binance_missing_since": pos_local["binance_missing_since"]})
                     except Exception:
@@ -452,7 +475,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
         else:
             try:
                 pos_local = position_manager.get_position(symbol, direction)
-                if isinstance(pos_local, dict):
+                if isinstance(pos_local, Mapping):
                     pos_local["binance_missing_since"] = int(time.time())
                     position_manager.update_position(symbol, direction, {"binance_missing_since": pos_local["binance_missing_since"]})
             except Exception:
@@ -470,8 +493,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
     if not _is_position_live_on_binance(symbol, direction):
         logger.log_warning(f"{symbol}-{direction} ⛔ No live position found on Binance during TP1. Marking missing and preserving local state.")
         try:
-            pos["binance_missing_since"] = int(time.time())
-            position_manager.update_position(symbol, direction, {"binance_missing_since": pos["binance_missing_since"]})
+            position_manager.update_position(symbol, direction, {"binance_missing_since": int(time.time())})
         except Exception:
             logger.log_debug("Failed to persist binance_missing_since for TP1.")
         try:
@@ -531,8 +553,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
         )
     except Exception:
         try:
-            with open("trade_exit_fallback.csv", "a") as f:
-                f.write(f"{datetime.utcnow().isoformat()},{symbol},TP1_EXIT,{price},{executed_qty},{pos.get('entry_price')}\n")
+            _write_fallback(f"{_iso_now()},{symbol},TP1_EXIT,{price},{executed_qty},{pos.get('entry_price')}\n")
         except Exception:
             logger.log_debug("Fallback write failed for TP1_exit.")
 
@@ -541,10 +562,7 @@ def handle_tp1(symbol: str, direction: str, price: float) -> None:
     try:
         notifier.send_info(f"{symbol} 🎯 Partial TP triggered: closed {executed_qty} @ {price:.6f}, SL -> BE")
     except Exception:
-        try:
-            send_discord_log(f"{symbol} 🎯 Partial TP triggered: closed {executed_qty} @ {price:.6f}, SL -> BE")
-        except Exception:
-            logger.log_warning(f"{symbol} ⚠️ Notifier & discord failed to send TP1 alert.")
+        queue_discord_log(symbol, f"{symbol} 🎯 Partial TP triggered: closed {executed_qty} @ {price:.6f}, SL -> BE")
 
 
 def price_poll_exit_loop() -> None:
@@ -627,9 +645,10 @@ def price_poll_exit_loop() -> None:
                             buffer_triggered = True
 
                         if buffer_triggered:
-                            pos["awaiting_trail_activation"] = False
-                            pos["trail_active"] = True
-                            pos["stop_loss"] = partial_tp
+                            with _positions_lock:
+                                pos["awaiting_trail_activation"] = False
+                                pos["trail_active"] = True
+                                pos["stop_loss"] = partial_tp
                             try:
                                 position_manager.update_position(symbol, direction, {"awaiting_trail_activation": False, "trail_active": True, "stop_loss": pos["stop_loss"]})
                             except Exception:
@@ -683,7 +702,8 @@ def price_poll_exit_loop() -> None:
                             logger.log_debug(f"{symbol}_{direction} trailing_sl could not be computed (None or invalid). Skipping trailing exit check.")
                             continue
 
-                        pos["trailing_sl"] = float(trailing_sl_val)
+                        with _positions_lock:
+                            pos["trailing_sl"] = float(trailing_sl_val)
                         try:
                             position_manager.update_position(symbol, direction, {"trailing_sl": pos["trailing_sl"]})
                         except Exception:
@@ -2,7 +2,7 @@ import json
 import os
 from core.logger import global_logger as logger
 from core.position_manager import position_manager
-from binance_utils import BinanceClient
+from binance_utils import get_default_client
 
 def main():
     logger.log_debug("Getting all positions")
@@ -13,7 +13,7 @@ def main():
         logger.log_info("✅ No open positions to recover.")
         return
 
-    binance_utils = BinanceClient()  # Fixed: Removed api_key and api_secret arguments
+    binance_utils = get_default_client()  # Fixed: Removed api_key and api_secret arguments
 
     for key, pos in positions.items():
         try:
@@ -13,6 +13,7 @@ import threading
 from threading import Lock
 from binance.client import Client
 from utils.discord_logger import send_discord_log
+from utils.notifier import Notifier
 from engine.rolling_engine import RollingEngine
 from engine.indicator_engine import enrich_indicators
 from core.logger import YogiLogger
@@ -34,7 +35,8 @@ from scalper.scalper_runner import run_scalper
 from scalper.scalper_candle_listener import scalper_warm_start_cache
 from scalper.scalper_candle_listener import on_candle_close as scalper_on_candle_close
 from ml_engine.ml_inference.ml_inference_cache import load_cache
-from binance_utils import BinanceClient
+from binance_utils import get_default_client
+from core.indicators import warmup as warmup_indicator_kernels
 
 try:
     from live.recover_open_positions import main as recover_positions
@@ -50,7 +52,7 @@ client = Client(
     api_secret=os.getenv("BINANCE_API_SECRET")
 )
 
-binance_utils = BinanceClient()  # Fixed: Removed api_key and api_secret arguments
+binance_utils = get_default_client()  # Fixed: Removed api_key and api_secret arguments
 atr_cache = ATRCache()
 BASE_PAIRS = CONFIG["base_pairs"]
 preload_models(BASE_PAIRS)
@@ -61,6 +63,34 @@ def run_safe_hourly_model(client):
     with run_lock:
         run_hourly_model(client)
 
+# === Unhandled exception reporting ===
+notifier = Notifier()
+
+def _report_unhandled(exc_type, exc, thread_name="main"):
+    logger.log_error(f"❌ Unhandled {exc_type.__name__} in {thread_name}: {exc}")
+    try:
+        notifier.send_critical(f"❌ Unhandled {exc_type.__name__} in {thread_name}. Restart or manual check recommended.\nError: {exc}")
+    except Exception:
+        pass
+
+def install_exception_hooks():
+    """Alert on exceptions that escape any thread (hot paths no longer wrap themselves)."""
+    default_sys_hook = sys.excepthook
+    default_thread_hook = threading.excepthook
+
+    def sys_hook(exc_type, exc, tb):
+        if not issubclass(exc_type, KeyboardInterrupt):
+            _report_unhandled(exc_type, exc)
+        default_sys_hook(exc_type, exc, tb)
+
+    def thread_hook(args):
+        if args.exc_type is not SystemExit:
+            _report_unhandled(args.exc_type, args.exc_value, getattr(args.thread, "name", "thread"))
+        default_thread_hook(args)
+
+    sys.excepthook = sys_hook
+    threading.excepthook = thread_hook
+
 # === Restart-safe Wrapper ===
 def run_with_restart(target_fn, label="stream"):
     while True:
@@ -149,8 +179,12 @@ def graceful_shutdown():
 
 # === MAIN ===
 if __name__ == "__main__":
+    install_exception_hooks()
     logger.log_info("🚀 Booting 1 Hour Machine Learning models...")
 
+    # Compile indicator kernels while config/positions/caches load
+    threading.Thread(target=warmup_indicator_kernels, daemon=True).start()
+
     # Validate config first
     logger.log_info("🔧 Validating configuration...")
     validate_scalper_config()
@@ -176,7 +210,7 @@ if __name__ == "__main__":
 
     try:
         while True:
-            logger.log_debug(f"CONFIG in runner.py: {CONFIG}")
+            logger.log_debug(f"CONFIG in runner.py: {dict(CONFIG)}")
             run_scalper()
             time.sleep(15)
     except KeyboardInterrupt:
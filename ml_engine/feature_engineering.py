@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+from utils.indicator_core import true_range
 
 def extract_features(df: pd.DataFrame, dropna: bool = True) -> pd.DataFrame:
     """
@@ -77,8 +78,4 @@ def compute_rsi(series: pd.Series, window: int = 7) -> pd.Series:
 
 
 def compute_atr(df: pd.DataFrame, window: int = 5) -> pd.Series:
-    hl = df["high"] - df["low"]
-    hc = abs(df["high"] - df["close"].shift())
-    lc = abs(df["low"] - df["close"].shift())
-    tr = pd.concat([hl, hc, lc], axis=1).max(axis=1)
-    return tr.rolling(window=window).mean()
+    return true_range(df).rolling(window=window).mean()
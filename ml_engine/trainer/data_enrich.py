@@ -3,6 +3,7 @@
 import os
 import pandas as pd
 import numpy as np
+from utils.indicator_core import true_range
 
 RAW_DIR = "data/historical_1h/"
 OUT_DIR = "data/enriched_1h/"
@@ -20,11 +21,7 @@ def compute_rsi(series: pd.Series, window: int = 7) -> pd.Series:
     return 100.0 - (100.0 / (1.0 + rs))
 
 def compute_atr(df: pd.DataFrame, window: int = 5) -> pd.Series:
-    high_low = df["high"] - df["low"]
-    high_close = abs(df["high"] - df["close"].shift())
-    low_close = abs(df["low"] - df["close"].shift())
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return tr.rolling(window=window).mean()
+    return true_range(df).rolling(window=window).mean()
 
 def enrich(df: pd.DataFrame, btc_df: pd.DataFrame = None) -> pd.DataFrame:
     df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
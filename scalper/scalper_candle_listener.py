@@ -1,7 +1,8 @@
 import os
 import time
+import numpy as np
 import pandas as pd
-from typing import Callable, List
+from typing import Callable, Dict, List
 from datetime import timezone
 from binance.client import Client
 from binance import ThreadedWebsocketManager
@@ -46,12 +47,33 @@ def fetch_5m_data(symbol: str, limit: int) -> List:
         logger.log_error(f"{symbol} ❌ Failed to fetch 5m data: {str(e)}")
         return []
 
+KLINE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+def klines_to_arrays(klines: List) -> Dict[str, np.ndarray]:
+    """Slice Binance kline rows into contiguous column arrays (ts as int64 ms, OHLCV as float64)."""
+    arr = np.asarray([k[:6] for k in klines], dtype=object)
+    cols = {'ts': arr[:, 0].astype(np.int64)}
+    for i, name in enumerate(KLINE_FIELDS, start=1):
+        cols[name] = arr[:, i].astype(np.float64)
+    return cols
+
+def arrays_to_dataframe(cols: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Materialize the standard OHLCV frame from column arrays without copying them."""
+    data = {'timestamp': pd.to_datetime(cols['ts'], unit='ms', utc=True)}
+    for name in KLINE_FIELDS:
+        data[name] = cols[name]
+    return pd.DataFrame(data, copy=False)
+
 def convert_klines_to_dataframe(klines: List) -> pd.DataFrame:
     """Convert Binance klines to DataFrame."""
     try:
         if not klines:
             logger.log_warning("No klines provided for DataFrame conversion")
             return pd.DataFrame()
+        if isinstance(klines[0], (list, tuple)):
+            df = arrays_to_dataframe(klines_to_arrays(klines))
+            logger.log_debug(f"Converted klines to DataFrame: rows={len(df)}, columns={df.columns.tolist()}")
+            return df
         df = pd.DataFrame(klines, columns=[
             'timestamp', 'open', 'high', 'low', 'close', 'volume',
             'close_time', 'quote_asset_volume', 'trades', 'taker_buy_base',
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from core.logger import global_logger as logger
+from utils.indicator_core import true_range
 from utils.notifier import Notifier, notifier
 from scalper import scalper_runner
 
@@ -8,11 +9,7 @@ def compute_ema(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
 
 def compute_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    high_low = df['high'] - df['low']
-    high_close = (df['high'] - df['close'].shift()).abs()
-    low_close = (df['low'] - df['close'].shift()).abs()
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return true_range.rolling(window=period).mean()
+    return true_range(df).rolling(window=period).mean()
 
 def enrich_dataframe(symbol: str, df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
     try:
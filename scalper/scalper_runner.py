@@ -6,9 +6,9 @@ from datetime import timezone
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from core.logger import global_logger as logger
-from core.config import CONFIG, get_usd_allocation
+from core.config import CONFIG, get_usd_allocation, reload_config_if_changed
 from core.position_manager import position_manager
-from binance_utils import BinanceClient
+from binance_utils import get_default_client
 from scalper.scalper_strategy import (
     calculate_ut_signals,
     _calculate_sl_tp,
@@ -26,7 +26,7 @@ client = Client(
     api_secret=os.getenv("BINANCE_API_SECRET"),
 )
 
-binance_utils = BinanceClient()
+binance_utils = get_default_client()
 shutdown_flag = Event()
 
 
@@ -40,7 +40,8 @@ def run_scalper():
     while not shutdown_flag.is_set():
         try:
             logger.log_info("[SCALPER] Starting new scalper cycle...")
-            logger.log_debug(f"Full config: {CONFIG}")
+            reload_config_if_changed()
+            logger.log_debug(f"Full config: {dict(CONFIG)}")
             open_positions = position_manager.get_all_positions()
             logger.log_info(f"Open positions: {list(open_positions.keys())}")
 
@@ -11,7 +11,6 @@
 
 from __future__ import annotations
 import io
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, Tuple, Union, Optional
@@ -19,12 +18,12 @@ import numpy as np
 import pandas as pd
 import pandas_ta as ta
 from core.logger import global_logger as logger
+from utils.indicator_core import true_range
 from core.config import get_scalper_config, get_scalper_usd_allocation
-from binance_utils import BinanceClient
+from binance_utils import get_default_client
 
-binance_utils = BinanceClient()
 
-OPEN_TRADES_FILE = 'open_positions.json'
+OPEN_TRADES_FILE = None  # None: the position manager's POSITIONS_FILE_DEFAULT
 
 # -----------------------------
 # Position Persistence Helpers
@@ -43,11 +42,11 @@ def _normalize_positions(raw: Dict) -> Dict[str, Dict]:
     return norm
 
 def load_open_trades(file_path=OPEN_TRADES_FILE) -> Dict:
+    # the position manager may write msgpack; read through its decoder
+    from core.position_manager import POSITIONS_FILE_DEFAULT, read_positions_file
     try:
-        with open(file_path, 'r') as f:
-            raw = json.load(f)
-            return _normalize_positions(raw)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return _normalize_positions(read_positions_file(file_path or POSITIONS_FILE_DEFAULT))
+    except (FileNotFoundError, ValueError):
         return {}
 
 def save_open_trades(open_trades: Dict, file_path=OPEN_TRADES_FILE):
@@ -200,12 +199,7 @@ def calculate_ut_signals(df: pd.DataFrame, settings: Dict) -> pd.DataFrame:
     buy_atr_period = int(_get_ut(settings, "buy_atr_period", 10))
     sell_atr_period = int(_get_ut(settings, "sell_atr_period", 10))
 
-    prev_close = df["close"].shift(1)
-    tr = pd.concat([
-        df["high"] - df["low"],
-        (df["high"] - prev_close).abs(),
-        (df["low"] - prev_close).abs(),
-    ], axis=1).max(axis=1)
+    tr = true_range(df)
 
     df["buy_atr"] = _rma(tr, buy_atr_period)
     df["sell_atr"] = _rma(tr, sell_atr_period)
@@ -262,7 +256,7 @@ def calculate_quantity(symbol: str, price: float, settings: Dict) -> float:
         leverage = float(symbol_precisions.get("leverage", settings.get("leverage", 20)))
         quantity_precision = int(symbol_precisions.get("quantityPrecision", 2))
 
-        balance = binance_utils.get_futures_balance()
+        balance = get_default_client().get_futures_balance()
         if balance is None or balance <= 0:
             logger.log_error(f"No USDT balance available for {symbol}")
             return 0.0
@@ -41,3 +41,55 @@ def send_discord_log(message: str, tag: str = "📣", retry: int = 3):
                 from core.logger import global_logger as logger
                 logger.log_error(f"❌ Failed to send Discord log after retries: {e}")
             time.sleep(2 ** i)
+
+
+# --- Background sender --------------------------------------------------------
+# Hot paths hand (symbol, message) to discord_queue instead of POSTing inline.
+# The worker waits _COALESCE_WINDOW after the first message, merges everything
+# queued for the same symbol into one post, and sends from its own thread.
+
+import queue
+import threading
+
+_COALESCE_WINDOW = 0.2  # seconds
+discord_queue: "queue.Queue" = queue.Queue(maxsize=1024)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _discord_worker():
+    while True:
+        batch = [discord_queue.get()]
+        deadline = time.monotonic() + _COALESCE_WINDOW
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(discord_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        grouped = {}
+        for symbol, message in batch:
+            grouped.setdefault(symbol, []).append(message)
+        for messages in grouped.values():
+            send_discord_log("\n".join(messages))
+
+
+def queue_discord_log(symbol: str, message: str):
+    """Non-blocking send_discord_log(); drops the oldest queued message when full."""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_discord_worker, name="discord-worker", daemon=True)
+                _worker.start()
+    while True:
+        try:
+            discord_queue.put_nowait((symbol, message))
+            return
+        except queue.Full:
+            try:
+                discord_queue.get_nowait()
+            except queue.Empty:
+                pass
@@ -2,6 +2,20 @@ import pandas as pd
 import numpy as np
 
 
+def true_range(df: pd.DataFrame) -> pd.Series:
+    """
+    True range per bar: max(high - low, |high - prev close|, |low - prev close|).
+    fmax skips the NaN previous close on the first bar, like DataFrame.max(axis=1).
+    """
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    prev_close = df["close"].shift(1).to_numpy(dtype=np.float64)
+    return pd.Series(
+        np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)]),
+        index=df.index,
+    )
+
+
 def compute_obv(close_series, volume_series):
     obv = [0]
     for i in range(1, len(close_series)):
@@ -54,11 +68,7 @@ def compute_hma(series: pd.Series, period: int):
 
 
 def compute_atr(df: pd.DataFrame, period: int = 14):
-    high_low = df['high'] - df['low']
-    high_close = (df['high'] - df['close'].shift()).abs()
-    low_close = (df['low'] - df['close'].shift()).abs()
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = tr.rolling(window=period).mean()
+    atr = true_range(df).rolling(window=period).mean()
     return atr
 
 
@@ -1,7 +1,7 @@
 # utils/price_fetcher.py
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 from binance.client import Client
 from dotenv import load_dotenv
 
@@ -23,3 +23,14 @@ def get_latest_price(symbol: str) -> Optional[float]:
     except Exception as e:
         logger.log_once(f"{symbol} ❌ Failed to fetch latest price: {e}", level="ERROR")
         return None
+
+def get_all_latest_prices() -> Dict[str, float]:
+    """
+    Fetch the latest price for every symbol in a single REST call.
+    Returns an empty dict if the tickers cannot be retrieved.
+    """
+    try:
+        return {t["symbol"]: float(t["price"]) for t in client.get_all_tickers()}
+    except Exception as e:
+        logger.log_once(f"❌ Failed to fetch all tickers: {e}", level="ERROR")
+        return {}